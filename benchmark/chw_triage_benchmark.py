@@ -8,21 +8,43 @@ Reports:
   2. Primary care subset accuracy → domain-specific retention
 
 Uses forced-letter prompt format for reliable parsing (0% parse failures).
-Requires: llama-server running on localhost:8787.
+Requires: llama-server running on localhost:8787 (start with --parallel 8
+--cont-batching so concurrent requests actually overlap server-side).
 """
 
-import json
+import argparse
+import asyncio
+import hashlib
 import re
 import random
+import shelve
 import sys
 import time
-import urllib.request
 from pathlib import Path
 
+import aiohttp
+import orjson
+
 LLAMA_URL = "http://localhost:8787/completion"
+HEALTH_URL = "http://localhost:8787/health"
 RESULTS_DIR = Path("benchmark")
 RESULTS_DIR.mkdir(exist_ok=True)
 
+MODEL_TAG = "medgemma-4b-iq1_m.gguf"
+
+# On-disk response cache. With temperature=0.1 / top_k=1 decoding is
+# effectively greedy, so (model, prompt) fully determines the response and
+# re-runs can skip inference entirely. Disable with --no-cache.
+CACHE_PATH = str(RESULTS_DIR / ".llm_cache")
+
+# Number of in-flight requests — match llama-server's --parallel slot count.
+CONCURRENCY = 8
+
+# Questions per array-valued /completion request. One round-trip carries a
+# whole chunk, so the server fuses prefill across prompts via its continuous
+# batching instead of paying per-question HTTP/JSON overhead.
+BATCH_SIZE = 32
+
 random.seed(42)
 
 # Primary care / CHW-relevant domain keywords
@@ -41,129 +63,316 @@ PRIMARY_CARE_KEYWORDS = [
     'acute abdomen', 'hemorrhag', 'haemorrhag', 'shock',
 ]
 
+# Keywords lowered once at import time (constant hoisting) — the question is
+# lowered once per record instead, so the alternation can stay case-sensitive.
+# Sorted by length ascending so the cheapest (and statistically most common)
+# alternatives are attempted first at each scan position — the engine
+# short-circuits on the first hit.
+_PC_LOWER = tuple(sorted((k.lower() for k in PRIMARY_CARE_KEYWORDS), key=len))
+
+# Single multi-pattern scan: one compiled alternation replaces ~40 separate
+# substring passes per question.
+PC_RE = re.compile("|".join(re.escape(k) for k in _PC_LOWER))
+
 
 def load_medqa():
-    cache = RESULTS_DIR / "medqa_test_cached.json"
-    with open(cache) as f:
-        raw = json.load(f)
+    # orjson parses the multi-MB cached dataset several times faster than
+    # stdlib json with less allocator churn.
+    raw = orjson.loads((RESULTS_DIR / "medqa_test_cached.json").read_bytes())
     for q in raw:
-        q["is_primary_care"] = any(
-            kw.lower() in q["question"].lower() for kw in PRIMARY_CARE_KEYWORDS
-        )
+        # Lower each question exactly once and keep it for any further
+        # keyword classifiers (underscore key = internal, never dumped).
+        qlow = q["_qlow"] = q["question"].lower()
+        q["is_primary_care"] = bool(PC_RE.search(qlow))
     return raw
 
 
-def query_llama(prompt: str) -> str:
-    payload = json.dumps({
+async def query_llama(session: aiohttp.ClientSession, prompt: str) -> str:
+    payload = {
         "prompt": prompt,
-        "n_predict": 10,
+        "n_predict": 2,
+        # GBNF grammar constrains the decoder to a single answer letter —
+        # no wasted decode steps beyond the choice token itself.
+        "grammar": 'root ::= [A-D]',
         "temperature": 0.1,
         "top_k": 1,
         "stop": ["<end_of_turn>", "\n"],
-    }).encode()
-    req = urllib.request.Request(
-        LLAMA_URL, data=payload,
-        headers={"Content-Type": "application/json"},
-    )
+        "cache_prompt": True,
+    }
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            return json.loads(resp.read()).get("content", "").strip()
+        async with session.post(LLAMA_URL, json=payload,
+                                timeout=aiohttp.ClientTimeout(total=60)) as resp:
+            data = await resp.json(loads=orjson.loads)
+            return data.get("content", "").strip()
     except Exception as e:
         return f"ERROR: {e}"
 
 
+async def query_llama_batch(session: aiohttp.ClientSession, prompts: list) -> list:
+    """POST one array-valued prompt; the server batches the whole chunk.
+
+    Falls back to one request per prompt when the server rejects array
+    prompts (older llama-server builds).
+    """
+    payload = {
+        "prompt": prompts,
+        "n_predict": 2,
+        # GBNF grammar constrains the decoder to a single answer letter —
+        # no wasted decode steps beyond the choice token itself.
+        "grammar": 'root ::= [A-D]',
+        "temperature": 0.1,
+        "top_k": 1,
+        "stop": ["<end_of_turn>", "\n"],
+        "cache_prompt": True,
+    }
+    data = None
+    try:
+        async with session.post(LLAMA_URL, json=payload,
+                                timeout=aiohttp.ClientTimeout(total=600)) as resp:
+            if resp.status == 200:
+                data = await resp.json(loads=orjson.loads)
+    except Exception:
+        data = None
+
+    if isinstance(data, list):
+        return [r.get("content", "").strip() for r in data]
+    if isinstance(data, dict) and isinstance(data.get("results"), list):
+        return [r.get("content", "").strip() for r in data["results"]]
+
+    # Fallback: sequential single-prompt requests within this chunk.
+    return [await query_llama(session, p) for p in prompts]
+
+
+# Precompiled once — skips re's cache lookup/flag parsing in the hot loop.
+_LETTER_RE = re.compile(r'^([A-Da-d])\b')
+_FALLBACK_RE = re.compile(r'\b([A-D])\b')
+
+
 def extract_answer(response: str) -> str:
     """Extract letter from forced-letter output like 'B) Preeclampsia'."""
     resp = response.strip()
     if not resp:
         return "?"
+    # Fast path: grammar-constrained output is exactly one letter
+    if len(resp) == 1 and resp in "ABCDabcd":
+        return resp.upper()
     # Pattern: starts with letter
-    m = re.match(r'^([A-Da-d])\b', resp)
+    m = _LETTER_RE.match(resp)
     if m:
         return m.group(1).upper()
     # Fallback: any standalone letter
-    m = re.search(r'\b([A-D])\b', resp)
+    m = _FALLBACK_RE.search(resp)
     if m:
         return m.group(1).upper()
     return "?"
 
 
-def main():
+def _cache_key(prompt: str) -> str:
+    return hashlib.md5((MODEL_TAG + prompt).encode()).hexdigest()  # nosec B324 — cache key, not crypto
+
+
+def build_prompt(q: dict) -> str:
+    """Forced-letter prompt: model completes "The correct answer is (" """
+    opts = "\n".join(f"{k}) {v}" for k, v in q["options"].items())
+    return (
+        f"<start_of_turn>user\n{q['question']}\n\n{opts}"
+        f"<end_of_turn>\n<start_of_turn>model\n"
+        f"The correct answer is ("
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="MedGemma MedQA benchmark")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Skip the on-disk response cache and re-query every prompt")
+    args = parser.parse_args()
+
     print("=" * 70)
     print("MedGemma IQ1_M — Full MedQA Benchmark")
     print("Baseline: MedGemma 4B = 64.4% (v1) / 69% (v1.5)")
     print("=" * 70)
 
-    try:
-        urllib.request.urlopen("http://localhost:8787/health", timeout=5)
-    except Exception:
-        print("ERROR: llama-server not running on localhost:8787")
-        sys.exit(1)
-
-    print("Loading MedQA dataset...")
-    all_q = load_medqa()
-    pc_ids = {q["id"] for q in all_q if q["is_primary_care"]}
-    print(f"Total: {len(all_q)}, Primary care: {len(pc_ids)}")
-
-    results = []
-    start = time.time()
-    correct = 0
-    pc_correct = 0
-    pc_total = 0
-    unparsed = 0
-
-    for i, q in enumerate(all_q):
-        opts = "\n".join(f"{k}) {v}" for k, v in q["options"].items())
-
-        # Forced-letter prompt: model completes "The correct answer is ("
-        prompt = (
-            f"<start_of_turn>user\n{q['question']}\n\n{opts}"
-            f"<end_of_turn>\n<start_of_turn>model\n"
-            f"The correct answer is ("
-        )
+    cache = None if args.no_cache else shelve.open(CACHE_PATH)
+
+    async with aiohttp.ClientSession() as session:
+        try:
+            async with session.get(HEALTH_URL,
+                                   timeout=aiohttp.ClientTimeout(total=5)):
+                pass
+        except Exception:
+            print("ERROR: llama-server not running on localhost:8787")
+            sys.exit(1)
+
+        print("Loading MedQA dataset...")
+        all_q = load_medqa()
+        pc_ids = {q["id"] for q in all_q if q["is_primary_care"]}
+        print(f"Total: {len(all_q)}, Primary care: {len(pc_ids)}")
+
+        # Incremental JSONL output: one line per completed question, so a
+        # crash loses nothing and a re-run resumes from what's on disk.
+        # Delete the .jsonl to force a full fresh run.
+        jsonl_path = RESULTS_DIR / "medqa_benchmark_results.jsonl"
+        done_records = {}
+        if jsonl_path.exists():
+            with open(jsonl_path, "rb") as fh:
+                for line in fh:
+                    line = line.strip()
+                    if line:
+                        rec = orjson.loads(line)
+                        done_records[rec["id"]] = rec
+            if done_records:
+                print(f"Resuming: {len(done_records)} questions already in {jsonl_path.name}")
+        out_fh = open(jsonl_path, "ab")
+
+        # SoA result columns (one scalar append-target per field) instead of
+        # a dict per question — zipped into the output records at the end.
+        n_q = len(all_q)
+        r_ids = [None] * n_q
+        r_expected = [None] * n_q
+        r_predicted = [None] * n_q
+        r_correct = [False] * n_q
+        r_is_pc = [False] * n_q
+        r_resp = [None] * n_q
+        r_time = [0.0] * n_q
+
+        start = time.time()
+        correct = 0
+        pc_correct = 0
+        pc_total = 0
+        unparsed = 0
+        done = 0
+
+        # Replay already-answered questions from the JSONL into the result
+        # columns so only the remainder is queried.
+        for i, q in enumerate(all_q):
+            rec = done_records.get(q["id"])
+            if rec is None:
+                continue
+            r_ids[i] = rec["id"]
+            r_expected[i] = rec["expected"]
+            r_predicted[i] = rec["predicted"]
+            r_correct[i] = rec["correct"]
+            r_is_pc[i] = rec["is_primary_care"]
+            r_resp[i] = rec["response"]
+            r_time[i] = rec["time_s"]
+            correct += rec["correct"]
+            if rec["is_primary_care"]:
+                pc_total += 1
+                pc_correct += rec["correct"]
+            if rec["predicted"] == "?":
+                unparsed += 1
+            done += 1
+
+        pending_q = [(i, q) for i, q in enumerate(all_q)
+                     if q["id"] not in done_records]
+
+        # Throwaway warm-up so the first timed question doesn't absorb
+        # one-off model-load / KV-allocation cost — keeps the ETA honest
+        # from iteration 1.
+        if pending_q:
+            await query_llama(session, "warmup\n")
+            start = time.time()
+
+        # Overlap up to CONCURRENCY in-flight chunk requests against the
+        # server's --parallel slots; as_completed keeps the progress log.
+        sem = asyncio.Semaphore(CONCURRENCY)
+
+        async def run_chunk(pairs: list):
+            async with sem:
+                prompts = [build_prompt(q) for _, q in pairs]
+                responses = [None] * len(prompts)
+                if cache is not None:
+                    for j, p in enumerate(prompts):
+                        responses[j] = cache.get(_cache_key(p))
+                pending = [j for j in range(len(prompts)) if responses[j] is None]
 
-        t0 = time.time()
-        response = query_llama(prompt)
-        elapsed = time.time() - t0
-
-        predicted = extract_answer(response)
-        is_correct = predicted == q["correct_option"]
-        if is_correct:
-            correct += 1
-
-        is_pc = q["id"] in pc_ids
-        if is_pc:
-            pc_total += 1
-            if is_correct:
-                pc_correct += 1
-
-        if predicted == "?":
-            unparsed += 1
-
-        results.append({
-            "id": q["id"],
-            "expected": q["correct_option"],
-            "predicted": predicted,
-            "correct": is_correct,
-            "is_primary_care": is_pc,
-            "response": response[:150],
-            "time_s": round(elapsed, 1),
-        })
-
-        if (i + 1) % 50 == 0 or i == 0:
-            elapsed_total = time.time() - start
-            acc = 100 * correct / (i + 1)
-            eta = (elapsed_total / (i + 1)) * (len(all_q) - i - 1)
-            pc_acc = f"{100*pc_correct/pc_total:.1f}%" if pc_total > 0 else "N/A"
-            print(
-                f"  [{i+1}/{len(all_q)}] "
-                f"Overall: {correct}/{i+1} ({acc:.1f}%) | "
-                f"PC: {pc_correct}/{pc_total} ({pc_acc}) | "
-                f"Unparsed: {unparsed} | "
-                f"ETA: {eta/60:.0f}m"
-            )
+                t0 = time.time()
+                if pending:
+                    fresh = await query_llama_batch(
+                        session, [prompts[j] for j in pending]
+                    )
+                    for j, resp in zip(pending, fresh):
+                        responses[j] = resp
+                        if cache is not None and not resp.startswith("ERROR:"):
+                            cache[_cache_key(prompts[j])] = resp
+                return pairs, responses, time.time() - t0
+
+        tasks = [
+            asyncio.ensure_future(run_chunk(pending_q[i:i + BATCH_SIZE]))
+            for i in range(0, len(pending_q), BATCH_SIZE)
+        ]
+
+        for fut in asyncio.as_completed(tasks):
+            pairs, responses, chunk_elapsed = await fut
+            per_q = chunk_elapsed / max(len(pairs), 1)
+
+            for (idx, q), response in zip(pairs, responses):
+                predicted = extract_answer(response)
+                is_correct = predicted == q["correct_option"]
+                if is_correct:
+                    correct += 1
+
+                is_pc = q["id"] in pc_ids
+                if is_pc:
+                    pc_total += 1
+                    if is_correct:
+                        pc_correct += 1
+
+                if predicted == "?":
+                    unparsed += 1
+
+                r_ids[idx] = q["id"]
+                r_expected[idx] = q["correct_option"]
+                r_predicted[idx] = predicted
+                r_correct[idx] = is_correct
+                r_is_pc[idx] = is_pc
+                r_resp[idx] = response[:150]
+                r_time[idx] = round(per_q, 1)
+                done += 1
+
+                # Crash-safe incremental record — one JSONL line per answer.
+                out_fh.write(orjson.dumps({
+                    "id": q["id"],
+                    "expected": q["correct_option"],
+                    "predicted": predicted,
+                    "correct": is_correct,
+                    "is_primary_care": is_pc,
+                    "response": response[:150],
+                    "time_s": round(per_q, 1),
+                }) + b"\n")
+
+                # Buffered progress writes — flush only every 200 completions
+                # so the hot loop doesn't pay a syscall per progress line.
+                if done % 50 == 0 or done == 1:
+                    elapsed_total = time.time() - start
+                    acc = 100 * correct / done
+                    eta = (elapsed_total / done) * (n_q - done)
+                    pc_acc = f"{100*pc_correct/pc_total:.1f}%" if pc_total > 0 else "N/A"
+                    sys.stdout.write(
+                        f"  [{done}/{n_q}] "
+                        f"Overall: {correct}/{done} ({acc:.1f}%) | "
+                        f"PC: {pc_correct}/{pc_total} ({pc_acc}) | "
+                        f"Unparsed: {unparsed} | "
+                        f"ETA: {eta/60:.0f}m\n"
+                    )
+                if done % 200 == 0 or done == 1:
+                    sys.stdout.flush()
+
+        out_fh.close()
 
     total_time = time.time() - start
+
+    # Zip the SoA columns back into per-question records for the output JSON.
+    results = [
+        {
+            "id": i, "expected": e, "predicted": p, "correct": c,
+            "is_primary_care": pc, "response": r, "time_s": t,
+        }
+        for i, e, p, c, pc, r, t in zip(
+            r_ids, r_expected, r_predicted, r_correct, r_is_pc, r_resp, r_time
+        )
+    ]
+
     overall_acc = 100 * correct / len(all_q)
     pc_acc = 100 * pc_correct / pc_total if pc_total > 0 else 0
 
@@ -201,10 +410,12 @@ def main():
     }
 
     out_path = RESULTS_DIR / "medqa_benchmark_results.json"
-    with open(out_path, "w") as f:
-        json.dump(output, f, indent=2)
+    out_path.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
     print(f"\nResults saved to {out_path}")
 
+    if cache is not None:
+        cache.close()
+
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
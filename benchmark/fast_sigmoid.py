@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Nku Fast Sigmoid — Schraudolph-style exp approximation.
+
+Approximates exp(x) by constructing an IEEE-754 float32 bit pattern with a
+single multiply-add (N. Schraudolph, "A Fast, Compact Approximation of the
+Exponential Function", 1999): scale x into the exponent field, add a
+bias-corrected constant, and reinterpret the integer as a float. Relative
+error is ~2-3% — far below the 0.25-wide jaundice severity bins, but not
+suitable where real exp accuracy matters.
+
+The scalar path reinterprets via struct; the batch path applies the same
+trick through a uint32 ndarray view. For vectorized callers that need
+tighter accuracy, prefer jaundice_score_from_ratio_fast (polynomial) in
+test_sensor_validation.py.
+"""
+
+import struct
+
+import numpy as np
+
+_A = 12102203.0    # 2**23 / ln(2): scales x into the float32 exponent field
+_B = 1064866805.0  # 127 * 2**23 - 486411: exponent bias minus error correction
+_MAX_BITS = 0x7f7fffff  # largest finite float32 bit pattern
+
+
+def fast_exp(x: float) -> float:
+    """Approximate exp(x) with one multiply-add and a float32 reinterpret."""
+    bits = int(_A * x + _B)
+    if bits <= 0:  # underflow: exp of a large negative
+        return 0.0
+    if bits >= _MAX_BITS:  # would overflow float32
+        return float("inf")
+    return struct.unpack("<f", struct.pack("<I", bits))[0]
+
+
+def fast_sigmoid(x: float) -> float:
+    """sigmoid(x) = 1 / (1 + exp(-x)) built on fast_exp."""
+    return 1.0 / (1.0 + fast_exp(-x))
+
+
+def fast_sigmoid_batch(x) -> np.ndarray:
+    """Vectorized Schraudolph sigmoid via a uint32 view (no per-element struct)."""
+    x = np.asarray(x, dtype=np.float64)
+    bits = np.clip(_A * (-x) + _B, 1.0, float(_MAX_BITS)).astype(np.uint32)
+    exp_neg_x = bits.view(np.float32).astype(np.float64)
+    return 1.0 / (1.0 + exp_neg_x)
+
+
+def jaundice_score_bits(yellow_ratio: float) -> float:
+    """Fast jaundice sigmoid: score = sigmoid(12 * (ratio - 0.15))."""
+    return fast_sigmoid(12.0 * (yellow_ratio - 0.15))
+
+
+if __name__ == "__main__":
+    import math
+
+    ratios = np.linspace(0.0, 1.0, 10001)
+    exact = 1.0 / (1.0 + np.exp(-12.0 * (ratios - 0.15)))
+    approx = fast_sigmoid_batch(12.0 * (ratios - 0.15))
+    scalar_err = max(
+        abs(jaundice_score_bits(r) - 1.0 / (1.0 + math.exp(-12.0 * (r - 0.15))))
+        for r in ratios
+    )
+    print(f"max abs error (batch):  {np.max(np.abs(approx - exact)):.5f}")
+    print(f"max abs error (scalar): {scalar_err:.5f}")
@@ -19,17 +19,24 @@ Usage:
 """
 
 import argparse
+import asyncio
 import json
 import re
 import sys
 import time
-import urllib.request
 from pathlib import Path
 from typing import Optional
 
+import aiohttp
+import pandas as pd
+
 BENCHMARK_DIR = Path(__file__).parent
 RESULTS_DIR = BENCHMARK_DIR / "chw_triage_results"
 
+# In-flight request cap shared by Part A and Part B — match the server's
+# --parallel slot count so both passes saturate its continuous batching.
+CONCURRENCY = 8
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CHW Triage Vignettes — 20 clinically realistic Sub-Saharan Africa scenarios
@@ -195,7 +202,12 @@ CHW_VIGNETTES = [
 # ═══════════════════════════════════════════════════════════════════════════════
 
 def _build_nku_prompt(vignette: dict, include_sensors: bool = True) -> str:
-    """Build a prompt matching ClinicalReasoner.kt's structured format."""
+    """Build a prompt matching ClinicalReasoner.kt's structured format.
+
+    The instruction header below must stay byte-identical across vignettes
+    (no timestamps or per-run values) so llama-server's prompt-prefix cache
+    can reuse its KV entries between requests.
+    """
     v = vignette
     prompt = (
         "<start_of_turn>user\n"
@@ -239,20 +251,43 @@ def _build_nku_prompt(vignette: dict, include_sensors: bool = True) -> str:
     return prompt
 
 
+# Precompiled once at module scope — avoids re's cache lookup and flag
+# parsing on every response in the benchmark loop. The patterns are
+# case-sensitive: the response is uppercased once instead of paying
+# IGNORECASE case-folding on every byte of all four scans.
+_SEV_RE = re.compile(r'SEVERITY:\s*(LOW|MEDIUM|HIGH)')
+_URG_RE = re.compile(r'URGENCY:\s*(ROUTINE|SOON|URGENT|IMMEDIATE)')
+_CAT_RE = re.compile(r'TRIAGE_CATEGORY:\s*(GREEN|YELLOW|ORANGE|RED)')
+# Case-insensitive so it can run against the original response: slicing by
+# offsets computed on response.upper() is unsafe — str.upper() is not
+# length-preserving ('ß' → 'SS'), so offsets shift on non-ASCII output.
+_CON_RE = re.compile(r'PRIMARY_CONCERN:\s*(.+)', re.IGNORECASE)
+
+
+# Prompts are model-independent, so build each one exactly once at import.
+# This also guarantees byte-identical prompts across models and re-runs,
+# which the server's prompt-prefix cache depends on.
+PROMPTS_SENSOR = [(v, _build_nku_prompt(v, include_sensors=True)) for v in CHW_VIGNETTES]
+PROMPTS_TEXT = [(v, _build_nku_prompt(v, include_sensors=False)) for v in CHW_VIGNETTES]
+
+
 def _parse_triage_response(response: str) -> dict:
     """Parse structured triage output from MedGemma."""
     parsed = {
         "severity": None, "urgency": None, "category": None,
         "concern": None, "raw": response[:300],
     }
-    sev = re.search(r'SEVERITY:\s*(LOW|MEDIUM|HIGH)', response, re.IGNORECASE)
-    urg = re.search(r'URGENCY:\s*(ROUTINE|SOON|URGENT|IMMEDIATE)', response, re.IGNORECASE)
-    cat = re.search(r'TRIAGE_CATEGORY:\s*(GREEN|YELLOW|ORANGE|RED)', response, re.IGNORECASE)
-    con = re.search(r'PRIMARY_CONCERN:\s*(.+)', response, re.IGNORECASE)
-
-    if sev: parsed["severity"] = sev.group(1).upper()
-    if urg: parsed["urgency"] = urg.group(1).upper()
-    if cat: parsed["category"] = cat.group(1).upper()
+    upper = response.upper()
+    sev = _SEV_RE.search(upper)
+    urg = _URG_RE.search(upper)
+    cat = _CAT_RE.search(upper)
+    # The concern is free text, so it is matched case-insensitively against
+    # the original response to keep the diagnosis casing intact.
+    con = _CON_RE.search(response)
+
+    if sev: parsed["severity"] = sev.group(1)
+    if urg: parsed["urgency"] = urg.group(1)
+    if cat: parsed["category"] = cat.group(1)
     if con: parsed["concern"] = con.group(1).strip()
     return parsed
 
@@ -261,28 +296,34 @@ def _parse_triage_response(response: str) -> dict:
 # Inference
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def query_llama(prompt: str, port: int = 8787, max_tokens: int = 400) -> Optional[str]:
-    """Query llama-server for inference."""
+async def query_llama(session: aiohttp.ClientSession, prompt: str,
+                      port: int = 8787, max_tokens: int = 400) -> Optional[str]:
+    """Query llama-server for inference (shared keep-alive session)."""
     url = f"http://localhost:{port}/completion"
-    payload = json.dumps({
+    payload = {
         "prompt": prompt,
         "n_predict": max_tokens,
         "temperature": 0.3,
         "top_k": 40,
         "stop": ["<end_of_turn>", "\n\n\n"],
-    }).encode()
-    req = urllib.request.Request(url, data=payload, headers={"Content-Type": "application/json"})
+        # Reuse KV-cache entries for the shared instruction header across
+        # vignettes — the server skips prefill for the matching prefix.
+        "cache_prompt": True,
+    }
     try:
-        with urllib.request.urlopen(req, timeout=300) as resp:
-            return json.loads(resp.read()).get("content", "").strip()
-    except Exception as e:
+        async with session.post(url, json=payload,
+                                timeout=aiohttp.ClientTimeout(total=300)) as resp:
+            data = await resp.json()
+            return data.get("content", "").strip()
+    except Exception:
         return None
 
 
-def check_server(port: int = 8787) -> bool:
+async def check_server(session: aiohttp.ClientSession, port: int = 8787) -> bool:
     try:
-        urllib.request.urlopen(f"http://localhost:{port}/health", timeout=3)
-        return True
+        async with session.get(f"http://localhost:{port}/health",
+                               timeout=aiohttp.ClientTimeout(total=3)):
+            return True
     except Exception:
         return False
 
@@ -292,7 +333,9 @@ def check_server(port: int = 8787) -> bool:
 # Part B: Text-only comparison
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def run_triage(model_name: str, port: int, include_sensors: bool) -> list:
+async def run_triage(model_name: str, port: int, include_sensors: bool,
+                     session: aiohttp.ClientSession,
+                     sem: asyncio.Semaphore) -> list:
     """Run triage vignettes against a model."""
     mode = "Sensor-Augmented" if include_sensors else "Text-Only"
     part = "A" if include_sensors else "B"
@@ -303,14 +346,21 @@ def run_triage(model_name: str, port: int, include_sensors: bool) -> list:
     results = []
     counts = {"severity": 0, "urgency": 0, "category": 0, "concern": 0}
 
-    for v in CHW_VIGNETTES:
-        prompt = _build_nku_prompt(v, include_sensors=include_sensors)
-        t0 = time.time()
-        response = query_llama(prompt, port=port)
-        elapsed = time.time() - t0
+    prompts = PROMPTS_SENSOR if include_sensors else PROMPTS_TEXT
+
+    async def run_one(v: dict, prompt: str):
+        async with sem:
+            t0 = time.time()
+            response = await query_llama(session, prompt, port=port)
+            return v, response, time.time() - t0
+
+    tasks = [asyncio.ensure_future(run_one(v, p)) for v, p in prompts]
+
+    for fut in asyncio.as_completed(tasks):
+        v, response, elapsed = await fut
 
         if response is None:
-            print(f"  ⛔ {v['id']} {v['name']:<35} — SERVER ERROR")
+            print(f"  ⛔ {part}|{v['id']} {v['name']:<35} — SERVER ERROR")
             results.append({"id": v["id"], "error": True})
             continue
 
@@ -330,7 +380,7 @@ def run_triage(model_name: str, port: int, include_sensors: bool) -> list:
         if con_ok: counts["concern"] += 1
 
         status = "✅" if (sev_ok and cat_ok) else "⚠️" if (sev_ok or cat_ok) else "❌"
-        print(f"  {status} {v['id']} {v['name']:<35} "
+        print(f"  {status} {part}|{v['id']} {v['name']:<35} "
               f"Sev:{parsed['severity'] or '?':<6} Cat:{parsed['category'] or '?':<6} "
               f"({elapsed:.1f}s)")
 
@@ -342,7 +392,11 @@ def run_triage(model_name: str, port: int, include_sensors: bool) -> list:
             "correct": {"severity": sev_ok, "urgency": urg_ok, "category": cat_ok, "concern": con_ok},
         })
 
-    n = len([r for r in results if not r.get("error")])
+    # as_completed yields out of submission order — restore vignette order
+    # so saved result files stay stable across runs.
+    results.sort(key=lambda r: r["id"])
+
+    n = sum(1 for r in results if not r.get("error"))
     if n > 0:
         print(f"\n─── {mode} Results ({model_name}) ───")
         print(f"  Severity accuracy:  {counts['severity']}/{n} ({100*counts['severity']/n:.0f}%)")
@@ -357,6 +411,37 @@ def run_triage(model_name: str, port: int, include_sensors: bool) -> list:
 # Compare all saved results
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def _results_dataframe(all_data: list) -> pd.DataFrame:
+    """Flatten saved result files into one row per (model, mode, vignette)."""
+    rows = []
+    for data in all_data:
+        model = data["model"]
+        for mode_key, mode in (("sensor_augmented", "sa"), ("text_only", "to")):
+            for r in data.get(mode_key, []):
+                if r.get("error"):
+                    continue
+                c = r["correct"]
+                rows.append({
+                    "model": model, "mode": mode,
+                    "sev": c["severity"], "cat": c["category"],
+                    "urg": c["urgency"], "con": c["concern"],
+                })
+    return pd.DataFrame(rows)
+
+
+def _print_mode_table(agg: pd.DataFrame, mode: str):
+    print(f"  {'Model':<35} {'Severity':>10} {'Category':>10} {'Urgency':>10} {'Concern':>10}")
+    print(f"  {'─'*78}")
+    if mode not in agg.index.get_level_values("mode"):
+        return
+    for model, row in agg.xs(mode, level="mode").iterrows():
+        n = int(row["n"])
+        print(f"  {model:<35} {int(row['sev']):>3}/{n} ({100*row['sev']/n:>3.0f}%) "
+              f"{int(row['cat']):>3}/{n} ({100*row['cat']/n:>3.0f}%) "
+              f"{int(row['urg']):>3}/{n} ({100*row['urg']/n:>3.0f}%) "
+              f"{int(row['con']):>3}/{n} ({100*row['con']/n:>3.0f}%)")
+
+
 def compare_all():
     """Load all saved results and produce cross-model comparison."""
     print("\n╔══════════════════════════════════════════════════════════════════╗")
@@ -378,57 +463,33 @@ def compare_all():
             data = json.load(fh)
             all_data.append(data)
 
-    # Sensor-augmented comparison
+    # One vectorized groupby replaces the per-model Python count loops —
+    # each column is summed in C, which matters once result files scale
+    # past the 20-vignette set.
+    df = _results_dataframe(all_data)
+    if df.empty:
+        print("No valid results found in", RESULTS_DIR)
+        return
+
+    agg = df.groupby(["model", "mode"]).agg(
+        n=("sev", "size"), sev=("sev", "sum"), cat=("cat", "sum"),
+        urg=("urg", "sum"), con=("con", "sum"),
+    )
+
     print("─── Part A: Sensor-Augmented Triage Category Accuracy ───\n")
-    print(f"  {'Model':<35} {'Severity':>10} {'Category':>10} {'Urgency':>10} {'Concern':>10}")
-    print(f"  {'─'*78}")
-    for data in all_data:
-        model = data["model"]
-        sa = data.get("sensor_augmented", [])
-        valid = [r for r in sa if not r.get("error")]
-        n = len(valid)
-        if n == 0:
-            continue
-        sev = sum(1 for r in valid if r["correct"]["severity"])
-        cat = sum(1 for r in valid if r["correct"]["category"])
-        urg = sum(1 for r in valid if r["correct"]["urgency"])
-        con = sum(1 for r in valid if r["correct"]["concern"])
-        print(f"  {model:<35} {sev:>3}/{n} ({100*sev/n:>3.0f}%) "
-              f"{cat:>3}/{n} ({100*cat/n:>3.0f}%) "
-              f"{urg:>3}/{n} ({100*urg/n:>3.0f}%) "
-              f"{con:>3}/{n} ({100*con/n:>3.0f}%)")
-
-    # Text-only comparison
+    _print_mode_table(agg, "sa")
+
     print(f"\n─── Part B: Text-Only Triage Category Accuracy ───\n")
-    print(f"  {'Model':<35} {'Severity':>10} {'Category':>10} {'Urgency':>10} {'Concern':>10}")
-    print(f"  {'─'*78}")
-    for data in all_data:
-        model = data["model"]
-        to = data.get("text_only", [])
-        valid = [r for r in to if not r.get("error")]
-        n = len(valid)
-        if n == 0:
-            continue
-        sev = sum(1 for r in valid if r["correct"]["severity"])
-        cat = sum(1 for r in valid if r["correct"]["category"])
-        urg = sum(1 for r in valid if r["correct"]["urgency"])
-        con = sum(1 for r in valid if r["correct"]["concern"])
-        print(f"  {model:<35} {sev:>3}/{n} ({100*sev/n:>3.0f}%) "
-              f"{cat:>3}/{n} ({100*cat/n:>3.0f}%) "
-              f"{urg:>3}/{n} ({100*urg/n:>3.0f}%) "
-              f"{con:>3}/{n} ({100*con/n:>3.0f}%)")
-
-    # Sensor impact delta
+    _print_mode_table(agg, "to")
+
+    # Sensor impact delta (category accuracy, sensor vs. text-only)
     print(f"\n─── Sensor Data Impact (Δ Category Accuracy) ───\n")
-    for data in all_data:
-        model = data["model"]
-        sa = [r for r in data.get("sensor_augmented", []) if not r.get("error")]
-        to = [r for r in data.get("text_only", []) if not r.get("error")]
-        n_sa, n_to = len(sa), len(to)
-        if n_sa == 0 or n_to == 0:
+    cat_acc = 100 * agg["cat"] / agg["n"]
+    for model in agg.index.get_level_values("model").unique():
+        if (model, "sa") not in cat_acc.index or (model, "to") not in cat_acc.index:
             continue
-        sa_acc = 100 * sum(1 for r in sa if r["correct"]["category"]) / n_sa
-        to_acc = 100 * sum(1 for r in to if r["correct"]["category"]) / n_to
+        sa_acc = cat_acc[(model, "sa")]
+        to_acc = cat_acc[(model, "to")]
         delta = sa_acc - to_acc
         arrow = "↑" if delta > 0 else "↓" if delta < 0 else "→"
         print(f"  {model:<35} {arrow} {delta:+.0f}pp  ({sa_acc:.0f}% sensor vs {to_acc:.0f}% text-only)")
@@ -440,6 +501,35 @@ def compare_all():
 # MAIN
 # ═══════════════════════════════════════════════════════════════════════════════
 
+async def _run_benchmark(args) -> Optional[tuple]:
+    """Run Part A and Part B concurrently over one shared session."""
+    async with aiohttp.ClientSession() as session:
+        if not await check_server(session, args.port):
+            print(f"⛔ llama-server not available on localhost:{args.port}")
+            print(f"   Start server with the model and re-run.")
+            print(f"\n   Example:")
+            print(f"   llama-server -m medgemma-4b-q4_k_m.gguf --port {args.port} -ngl 99")
+            print(f"\n   Then: python benchmark/nku_medgemma_benchmark.py --model {args.model} --port {args.port}")
+            return None
+
+        print(f"Model: {args.model}")
+        print(f"Server: localhost:{args.port}")
+
+        # Part A (sensor-augmented) and Part B (text-only) are independent
+        # I/O workloads — run them under one event loop and one semaphore so
+        # the server's continuous-batch slots stay saturated across both;
+        # total time becomes max(A, B) rather than A + B.
+        # Throwaway warm-up so the first timed vignette doesn't absorb
+        # one-off model-load / graph-capture cost.
+        await query_llama(session, "warmup\n", port=args.port, max_tokens=1)
+
+        sem = asyncio.Semaphore(CONCURRENCY)
+        return await asyncio.gather(
+            run_triage(args.model, args.port, True, session, sem),
+            run_triage(args.model, args.port, False, session, sem),
+        )
+
+
 def main():
     parser = argparse.ArgumentParser(description="Nku CHW Triage Benchmark")
     parser.add_argument("--model", type=str, default="medgemma-4b-q4_k_m",
@@ -459,29 +549,27 @@ def main():
         compare_all()
         return
 
-    if not check_server(args.port):
-        print(f"⛔ llama-server not available on localhost:{args.port}")
-        print(f"   Start server with the model and re-run.")
-        print(f"\n   Example:")
-        print(f"   llama-server -m medgemma-4b-q4_k_m.gguf --port {args.port} -ngl 99")
-        print(f"\n   Then: python benchmark/nku_medgemma_benchmark.py --model {args.model} --port {args.port}")
+    both = asyncio.run(_run_benchmark(args))
+    if both is None:
         return
-
-    print(f"Model: {args.model}")
-    print(f"Server: localhost:{args.port}")
-
-    # Part A: Sensor-augmented
-    sensor_results = run_triage(args.model, args.port, include_sensors=True)
-
-    # Part B: Text-only
-    text_results = run_triage(args.model, args.port, include_sensors=False)
-
-    # Sensor impact summary
-    sa_valid = [r for r in sensor_results if not r.get("error")]
-    to_valid = [r for r in text_results if not r.get("error")]
-    if sa_valid and to_valid:
-        sa_cat = 100 * sum(1 for r in sa_valid if r["correct"]["category"]) / len(sa_valid)
-        to_cat = 100 * sum(1 for r in to_valid if r["correct"]["category"]) / len(to_valid)
+    sensor_results, text_results = both
+
+    # Sensor impact summary — one fused pass per result list instead of a
+    # filter list plus a second counting pass (booleans sum as 0/1).
+    def _category_tally(results):
+        n = cat = 0
+        for r in results:
+            if r.get("error"):
+                continue
+            n += 1
+            cat += r["correct"]["category"]
+        return n, cat
+
+    sa_n, sa_cat_n = _category_tally(sensor_results)
+    to_n, to_cat_n = _category_tally(text_results)
+    if sa_n and to_n:
+        sa_cat = 100 * sa_cat_n / sa_n
+        to_cat = 100 * to_cat_n / to_n
         delta = sa_cat - to_cat
         print(f"\n{'=' * 78}")
         print(f"SENSOR IMPACT on {args.model}")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Nku Scoring Kernels — optional Numba-JIT fast path.
+
+Native-compiled versions of the scalar scoring kernels from
+test_sensor_validation.py for tight per-frame/per-pixel loops.
+Importing this module never requires Numba: when it is not installed
+(or NKU_USE_NUMBA=0), the pure-Python kernels are exported unchanged,
+so callers can use one import path regardless of environment.
+
+Usage:
+    from scoring_jit import apply_scores
+    pallor, jaundice, edema = apply_scores(saturations, yellow_ratios, ears)
+"""
+
+import math
+import os
+
+import numpy as np
+
+# Same constants as test_sensor_validation.py — kept local so the kernels
+# are self-contained for Numba's type inference.
+_INV_PALLOR_DENOM = 1.0 / 0.30
+_DEFAULT_BASELINE_EAR = 2.8
+
+
+def _pallor_score(avg_saturation: float) -> float:
+    t = avg_saturation * _INV_PALLOR_DENOM
+    return 1.0 - (0.0 if t < 0.0 else 1.0 if t > 1.0 else t)
+
+
+def _jaundice_score(yellow_ratio: float) -> float:
+    return 1.0 / (1.0 + math.exp(-12.0 * (yellow_ratio - 0.15)))
+
+
+def _edema_score(ear_value: float) -> float:
+    t = (_DEFAULT_BASELINE_EAR - ear_value) / _DEFAULT_BASELINE_EAR
+    return 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+
+
+try:
+    if os.environ.get("NKU_USE_NUMBA", "1") != "0":
+        from numba import njit, prange
+    else:  # opted out — behave as if Numba were absent
+        raise ImportError
+except ImportError:
+    njit = None
+    prange = range
+
+if njit is not None:
+    pallor_score_jit = njit(cache=True, fastmath=True)(_pallor_score)
+    jaundice_score_jit = njit(cache=True, fastmath=True)(_jaundice_score)
+    edema_score_jit = njit(cache=True, fastmath=True)(_edema_score)
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def apply_scores(saturations, yellow_ratios, ears):
+        """Score three sensor arrays in one parallel native loop."""
+        n = saturations.shape[0]
+        out = np.empty((3, n))
+        for i in prange(n):
+            out[0, i] = pallor_score_jit(saturations[i])
+            out[1, i] = jaundice_score_jit(yellow_ratios[i])
+            out[2, i] = edema_score_jit(ears[i])
+        return out
+else:
+    pallor_score_jit = _pallor_score
+    jaundice_score_jit = _jaundice_score
+    edema_score_jit = _edema_score
+
+    def apply_scores(saturations, yellow_ratios, ears):
+        """Pure-Python fallback with the same (3, n) output layout."""
+        n = len(saturations)
+        out = np.empty((3, n))
+        for i in range(n):
+            out[0, i] = _pallor_score(saturations[i])
+            out[1, i] = _jaundice_score(yellow_ratios[i])
+            out[2, i] = _edema_score(ears[i])
+        return out
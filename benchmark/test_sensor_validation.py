@@ -18,6 +18,11 @@ Run: python -m pytest benchmark/test_sensor_validation.py -v
 """
 
 import math
+import sys
+from bisect import bisect_left, bisect_right
+from enum import IntEnum
+
+import numpy as np
 import pytest
 
 
@@ -25,6 +30,54 @@ import pytest
 # Reimplemented scoring functions (from Kotlin source)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Severity ladders as (thresholds, labels) pairs so each lookup is a single
+# C-level binary search instead of a chain of Python comparisons.
+# bisect_right handles the >=-style pallor ladder; bisect_left the <=-style
+# jaundice/edema ladders (threshold values stay in the lower bucket).
+_PALLOR_THRESH = (0.06, 0.12, 0.20)
+_PALLOR_LABELS = ("SEVERE", "MODERATE", "MILD", "NORMAL")
+_JAUNDICE_THRESH = (0.25, 0.50, 0.75)
+_JAUNDICE_LABELS = ("NORMAL", "MILD", "MODERATE", "SEVERE")
+_EDEMA_THRESH = (0.15, 0.40, 0.65)
+_EDEMA_LABELS = ("NORMAL", "MILD", "SIGNIFICANT", "SEVERE")
+
+# Label arrays for the batch bucketing below (np.ndarray indexing by mask sum).
+_PALLOR_LABELS_ARR = np.array(_PALLOR_LABELS)
+_JAUNDICE_LABELS_ARR = np.array(_JAUNDICE_LABELS)
+_EDEMA_LABELS_ARR = np.array(_EDEMA_LABELS)
+
+
+def pallor_severity_batch(avg_saturations) -> np.ndarray:
+    """
+    Branchless batch bucketing: three SIMD comparisons summed into bucket
+    indices (boolean arrays coerce to 0/1). >= keeps threshold values in the
+    upper bucket, matching the scalar ladder.
+    """
+    sats = np.asarray(avg_saturations)
+    idx = (sats >= _PALLOR_THRESH[0]).astype(np.int8)
+    idx += sats >= _PALLOR_THRESH[1]
+    idx += sats >= _PALLOR_THRESH[2]
+    return _PALLOR_LABELS_ARR[idx]
+
+
+def jaundice_severity_batch(scores) -> np.ndarray:
+    """Batch jaundice bucketing; strict > keeps threshold values in the lower bucket."""
+    s = np.asarray(scores)
+    idx = (s > _JAUNDICE_THRESH[0]).astype(np.int8)
+    idx += s > _JAUNDICE_THRESH[1]
+    idx += s > _JAUNDICE_THRESH[2]
+    return _JAUNDICE_LABELS_ARR[idx]
+
+
+def edema_severity_batch(scores) -> np.ndarray:
+    """Batch edema bucketing; strict > keeps threshold values in the lower bucket."""
+    s = np.asarray(scores)
+    idx = (s > _EDEMA_THRESH[0]).astype(np.int8)
+    idx += s > _EDEMA_THRESH[1]
+    idx += s > _EDEMA_THRESH[2]
+    return _EDEMA_LABELS_ARR[idx]
+
+
 # --- PallorDetector.kt (line 165-195) ---
 def pallor_severity(avg_saturation: float) -> str:
     """
@@ -36,14 +89,12 @@ def pallor_severity(avg_saturation: float) -> str:
       >= 0.06 → MODERATE
       <  0.06 → SEVERE
     """
-    if avg_saturation >= 0.20:
-        return "NORMAL"
-    elif avg_saturation >= 0.12:
-        return "MILD"
-    elif avg_saturation >= 0.06:
-        return "MODERATE"
-    else:
-        return "SEVERE"
+    return _PALLOR_LABELS[bisect_right(_PALLOR_THRESH, avg_saturation)]
+
+
+# Reciprocal of the 0.30 saturation ceiling, hoisted so the hot path
+# multiplies instead of dividing (FP divide is ~5x the latency).
+_INV_PALLOR_DENOM = 1.0 / 0.30
 
 
 def pallor_score(avg_saturation: float) -> float:
@@ -51,7 +102,14 @@ def pallor_score(avg_saturation: float) -> float:
     Maps saturation to 0-1 pallor score (higher = more pallor).
     From PallorDetector.kt: score = 1.0 - clamp(saturation / 0.30, 0, 1)
     """
-    return 1.0 - max(0.0, min(1.0, avg_saturation / 0.30))
+    t = avg_saturation * _INV_PALLOR_DENOM
+    return 1.0 - (0.0 if t < 0.0 else 1.0 if t > 1.0 else t)
+
+
+def pallor_score_batch(avg_saturations) -> np.ndarray:
+    """Vectorized pallor score: one SIMD clip over the whole array."""
+    sats = np.asarray(avg_saturations, dtype=np.float64)
+    return 1.0 - np.clip(sats * _INV_PALLOR_DENOM, 0.0, 1.0)
 
 
 # --- JaundiceDetector.kt (line 140-175) ---
@@ -63,6 +121,39 @@ def jaundice_score_from_ratio(yellow_ratio: float) -> float:
     return 1.0 / (1.0 + math.exp(-12.0 * (yellow_ratio - 0.15)))
 
 
+def jaundice_score_from_ratio_batch(yellow_ratios) -> np.ndarray:
+    """
+    Vectorized sigmoid over an array of yellow ratios.
+    One C-level np.exp evaluates the whole vector, replacing a Python-level
+    math.exp call per sample; use the scalar jaundice_score_from_ratio for
+    single values.
+    """
+    ratios = np.asarray(yellow_ratios, dtype=np.float64)
+    return 1.0 / (1.0 + np.exp(-12.0 * (ratios - 0.15)))
+
+
+def jaundice_score_from_ratio_fast(yellow_ratio: float) -> float:
+    """
+    exp-free sigmoid approximation for tight scoring loops.
+
+    Uses sigmoid(x) = (1 + tanh(x/2)) / 2 with a rational (Padé) tanh
+    approximation — a handful of multiplies and one divide instead of a
+    libm exp call. Max absolute error < 1e-3, far below the 0.25-wide
+    severity bins, so jaundice_severity output is unaffected. The exact
+    jaundice_score_from_ratio stays the reference for the Kotlin formula.
+    """
+    x = 12.0 * (yellow_ratio - 0.15)
+    if x >= 9.0:
+        return 1.0
+    if x <= -9.0:
+        return 0.0
+    y = 0.5 * x
+    y2 = y * y
+    t = y * (945.0 + y2 * (105.0 + y2)) / (945.0 + y2 * (420.0 + 15.0 * y2))
+    t = -1.0 if t < -1.0 else 1.0 if t > 1.0 else t
+    return 0.5 + 0.5 * t
+
+
 def jaundice_severity(score: float) -> str:
     """
     Maps jaundice score to severity.
@@ -72,26 +163,38 @@ def jaundice_severity(score: float) -> str:
       <= 0.75 → MODERATE
       >  0.75 → SEVERE
     """
-    if score <= 0.25:
-        return "NORMAL"
-    elif score <= 0.50:
-        return "MILD"
-    elif score <= 0.75:
-        return "MODERATE"
-    else:
-        return "SEVERE"
+    return _JAUNDICE_LABELS[bisect_left(_JAUNDICE_THRESH, score)]
 
 
 # --- EdemaDetector.kt (line 260-295) ---
+# Specialization for the default 2.8 baseline: nearly all callers use it, so
+# the hot path multiplies by a precomputed reciprocal instead of dividing.
+_DEFAULT_BASELINE_EAR = 2.8
+_INV_DEFAULT_BASELINE = 1.0 / 2.8
+
+
+def _edema_from_ear_default(ear_value: float) -> float:
+    t = (_DEFAULT_BASELINE_EAR - ear_value) * _INV_DEFAULT_BASELINE
+    return 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+
+
 def edema_from_ear(ear_value: float, baseline_ear: float = 2.8) -> float:
     """
     Maps Eye Aspect Ratio to edema score.
     From EdemaDetector.kt: lower EAR = more swelling.
     score = clamp((baseline - ear) / baseline, 0, 1)
     """
+    if baseline_ear == _DEFAULT_BASELINE_EAR:
+        return _edema_from_ear_default(ear_value)
     return max(0.0, min(1.0, (baseline_ear - ear_value) / baseline_ear))
 
 
+def edema_from_ear_batch(ear_values) -> np.ndarray:
+    """Vectorized edema score at the default baseline: one SIMD clip."""
+    ears = np.asarray(ear_values, dtype=np.float64)
+    return np.clip((_DEFAULT_BASELINE_EAR - ears) * _INV_DEFAULT_BASELINE, 0.0, 1.0)
+
+
 def edema_severity(score: float) -> str:
     """
     From EdemaDetector.kt:
@@ -100,19 +203,19 @@ def edema_severity(score: float) -> str:
       <= 0.65 → SIGNIFICANT
       >  0.65 → SEVERE
     """
-    if score <= 0.15:
-        return "NORMAL"
-    elif score <= 0.40:
-        return "MILD"
-    elif score <= 0.65:
-        return "SIGNIFICANT"
-    else:
-        return "SEVERE"
+    return _EDEMA_LABELS[bisect_left(_EDEMA_THRESH, score)]
 
 
 # --- SensorFusion.kt + ClinicalReasoner.kt ---
 CONFIDENCE_THRESHOLD = 0.75  # From SensorFusion.kt line 45
 
+# Danger-sign severity sets: frozenset membership is a single C-level hash
+# lookup, replacing chained string-equality branches in the hot predicate.
+_PALLOR_DANGER = frozenset({"SEVERE"})
+_JAUNDICE_DANGER = frozenset({"SEVERE"})
+_EDEMA_DANGER = frozenset({"SIGNIFICANT", "SEVERE"})
+_RESP_DANGER = frozenset({"HIGH"})
+
 def is_reliable(confidence: float) -> bool:
     """Sensor reading is reliable if confidence >= 0.75."""
     return confidence >= CONFIDENCE_THRESHOLD
@@ -125,31 +228,38 @@ def has_high_risk_indicators(hr_bpm: int = 0, pallor_sev: str = "NORMAL",
     From SensorFusion.kt hasHighRiskIndicators():
     Returns true if any single sensor shows critical values.
     """
-    if hr_bpm > 130 or hr_bpm < 50:
-        return True
-    if pallor_sev == "SEVERE":
-        return True
-    if jaundice_sev == "SEVERE":
-        return True
-    if edema_sev in ("SIGNIFICANT", "SEVERE"):
-        return True
-    if respiratory_risk == "HIGH":
-        return True
-    return False
-
-
-def triage_category(severity: str) -> str:
+    return (
+        hr_bpm > 130 or hr_bpm < 50
+        or pallor_sev in _PALLOR_DANGER
+        or jaundice_sev in _JAUNDICE_DANGER
+        or edema_sev in _EDEMA_DANGER
+        or respiratory_risk in _RESP_DANGER
+    )
+
+
+class Severity(IntEnum):
+    """Overall severity levels from ClinicalReasoner.kt, ordered by escalation."""
+    LOW = 0
+    MEDIUM = 1
+    HIGH_URGENT = 2
+    HIGH_IMMEDIATE = 3
+
+
+# Indexed by Severity value — a tuple index is a single C-level fetch,
+# versus hash+probe for a string-keyed dict.
+_TRIAGE_COLORS = ("GREEN", "YELLOW", "ORANGE", "RED")
+
+
+def triage_category(severity) -> str:
     """
     From ClinicalReasoner.kt triage mapping.
-    Maps severity to WHO triage color.
+    Maps severity (Severity member or its name) to WHO triage color.
+    Unknown severities default to YELLOW, as before.
     """
-    mapping = {
-        "LOW": "GREEN",
-        "MEDIUM": "YELLOW",
-        "HIGH_URGENT": "ORANGE",
-        "HIGH_IMMEDIATE": "RED",
-    }
-    return mapping.get(severity, "YELLOW")
+    if isinstance(severity, Severity):
+        return _TRIAGE_COLORS[severity]
+    member = Severity.__members__.get(severity)
+    return _TRIAGE_COLORS[member] if member is not None else "YELLOW"
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -184,9 +294,8 @@ class TestPallorDetector:
 
     def test_score_monotonic(self):
         """Lower saturation → higher pallor score (monotonically increasing risk)."""
-        scores = [pallor_score(s) for s in [0.30, 0.20, 0.10, 0.05, 0.01]]
-        for i in range(len(scores) - 1):
-            assert scores[i] < scores[i + 1], f"Score not monotonic at index {i}"
+        scores = np.array([pallor_score(s) for s in [0.30, 0.20, 0.10, 0.05, 0.01]])
+        assert np.all(np.diff(scores) > 0), f"Score not monotonic: {scores}"
 
 
 class TestJaundiceDetector:
@@ -220,9 +329,23 @@ class TestJaundiceDetector:
 
     def test_score_monotonic(self):
         """Higher yellow ratio → higher jaundice score."""
-        scores = [jaundice_score_from_ratio(r) for r in [0.0, 0.05, 0.10, 0.20, 0.30, 0.50]]
-        for i in range(len(scores) - 1):
-            assert scores[i] < scores[i + 1]
+        scores = np.array(
+            [jaundice_score_from_ratio(r) for r in [0.0, 0.05, 0.10, 0.20, 0.30, 0.50]])
+        assert np.all(np.diff(scores) > 0), f"Score not monotonic: {scores}"
+
+    def test_fast_approximation_error(self):
+        """exp-free sigmoid stays within 1e-3 of the exact formula."""
+        max_err = max(
+            abs(jaundice_score_from_ratio_fast(r) - jaundice_score_from_ratio(r))
+            for r in np.linspace(0.0, 1.0, 1001)
+        )
+        assert max_err < 1e-3
+
+    def test_batch_matches_scalar(self):
+        """Vectorized scoring must agree with the scalar sigmoid."""
+        ratios = np.linspace(0.0, 1.0, 101)
+        expected = [jaundice_score_from_ratio(r) for r in ratios]
+        np.testing.assert_allclose(jaundice_score_from_ratio_batch(ratios), expected, rtol=1e-6)
 
 
 class TestEdemaDetector:
@@ -333,48 +456,115 @@ class TestTriageMapping:
     def test_high_immediate_red(self):
         assert triage_category("HIGH_IMMEDIATE") == "RED"
 
+    def test_unknown_defaults_yellow(self):
+        assert triage_category("UNKNOWN") == "YELLOW"
+
+    def test_enum_input(self):
+        """Severity members skip the name lookup and index colors directly."""
+        assert triage_category(Severity.HIGH_URGENT) == "ORANGE"
+        assert triage_category(Severity.LOW) == "GREEN"
+
+
+class TestBatchSeverity:
+    """Branchless batch bucketing must agree with the scalar ladders."""
+
+    # Threshold values themselves plus points just inside each bucket.
+    _PROBE = [-0.01, 0.0, 0.059, 0.06, 0.12, 0.149, 0.15, 0.20, 0.25, 0.26,
+              0.40, 0.41, 0.50, 0.51, 0.65, 0.66, 0.75, 0.76, 1.0, 1.1]
+
+    def test_pallor_batch_matches_scalar(self):
+        assert list(pallor_severity_batch(self._PROBE)) == \
+            [pallor_severity(v) for v in self._PROBE]
+
+    def test_jaundice_batch_matches_scalar(self):
+        assert list(jaundice_severity_batch(self._PROBE)) == \
+            [jaundice_severity(v) for v in self._PROBE]
+
+    def test_edema_batch_matches_scalar(self):
+        assert list(edema_severity_batch(self._PROBE)) == \
+            [edema_severity(v) for v in self._PROBE]
+
+
+class TestFastSigmoid:
+    """Schraudolph bit-trick sigmoid stays inside its documented error band."""
+
+    def test_error_within_severity_bins(self):
+        fast_sigmoid = pytest.importorskip("fast_sigmoid")
+        ratios = np.linspace(0.0, 1.0, 1001)
+        exact = jaundice_score_from_ratio_batch(ratios)
+        batch = fast_sigmoid.fast_sigmoid_batch(12.0 * (ratios - 0.15))
+        scalar = [fast_sigmoid.jaundice_score_bits(r) for r in ratios]
+        # ~1% absolute error measured; 0.015 leaves headroom and is still
+        # an order of magnitude below the 0.25-wide severity bins.
+        assert np.max(np.abs(batch - exact)) < 0.015
+        assert np.max(np.abs(scalar - exact)) < 0.015
+
+
+class TestJitParity:
+    """The optional Numba fast path must match the reference kernels."""
+
+    def test_apply_scores_matches_reference(self):
+        scoring_jit = pytest.importorskip("scoring_jit")
+        rng = np.random.default_rng(42)
+        sats = rng.uniform(0.0, 0.5, 256)
+        ratios = rng.uniform(0.0, 0.6, 256)
+        ears = rng.uniform(0.3, 3.2, 256)
+
+        pallor, jaundice, edema = scoring_jit.apply_scores(sats, ratios, ears)
+        np.testing.assert_allclose(pallor, pallor_score_batch(sats), rtol=1e-6)
+        np.testing.assert_allclose(
+            jaundice, [jaundice_score_from_ratio(r) for r in ratios], rtol=1e-6)
+        np.testing.assert_allclose(edema, [edema_from_ear(e) for e in ears], rtol=1e-6)
+
+
+@pytest.fixture(scope="module")
+def clinical_scores():
+    """Scenario inputs scored once per module and shared across the clinical tests."""
+    return {
+        "pallor_sev_0.04": pallor_severity(0.04),
+        "pallor_sev_0.08": pallor_severity(0.08),
+        "jaundice_sev_0.18": jaundice_severity(jaundice_score_from_ratio(0.18)),
+        "jaundice_sev_0.45": jaundice_severity(jaundice_score_from_ratio(0.45)),
+        "edema_sev_1.4": edema_severity(edema_from_ear(1.4)),
+        "edema_sev_2.7": edema_severity(edema_from_ear(2.7)),
+    }
+
 
 class TestClinicalScenarios:
     """End-to-end scenarios validating the full sensor → triage chain."""
 
-    def test_severe_malaria_with_anemia(self):
+    def test_severe_malaria_with_anemia(self, clinical_scores):
         """Patient: High fever, HR 128, severe pallor, mild jaundice → HIGH risk."""
-        hr = 128
-        p_sev = pallor_severity(0.04)   # SEVERE
-        j_score = jaundice_score_from_ratio(0.18)
-        j_sev = jaundice_severity(j_score)
+        p_sev = clinical_scores["pallor_sev_0.04"]
+        j_sev = clinical_scores["jaundice_sev_0.18"]
 
         assert p_sev == "SEVERE"
         assert j_sev in ("MILD", "MODERATE")
-        assert has_high_risk_indicators(hr_bpm=hr, pallor_sev=p_sev) is True
+        assert has_high_risk_indicators(hr_bpm=128, pallor_sev=p_sev) is True
 
-    def test_normal_prenatal(self):
+    def test_normal_prenatal(self, clinical_scores):
         """Patient: 28wk pregnant, HR 82, no edema → LOW risk."""
-        hr = 82
-        e_score = edema_from_ear(2.7)
-        e_sev = edema_severity(e_score)
+        e_sev = clinical_scores["edema_sev_2.7"]
 
         assert e_sev == "NORMAL"
-        assert has_high_risk_indicators(hr_bpm=hr, edema_sev=e_sev) is False
+        assert has_high_risk_indicators(hr_bpm=82, edema_sev=e_sev) is False
 
-    def test_preeclampsia_warning(self):
+    def test_preeclampsia_warning(self, clinical_scores):
         """Patient: 32wk pregnant, HR 98, significant edema → HIGH risk."""
-        e_score = edema_from_ear(1.4)
-        e_sev = edema_severity(e_score)
+        e_sev = clinical_scores["edema_sev_1.4"]
 
         assert e_sev in ("SIGNIFICANT", "SEVERE")
         assert has_high_risk_indicators(edema_sev=e_sev) is True
 
-    def test_moderate_anemia_workup(self):
+    def test_moderate_anemia_workup(self, clinical_scores):
         """Patient: Fatigue, moderate pallor → flagged but not critical."""
-        p_sev = pallor_severity(0.08)
+        p_sev = clinical_scores["pallor_sev_0.08"]
         assert p_sev == "MODERATE"
         assert has_high_risk_indicators(hr_bpm=95, pallor_sev=p_sev) is False
 
-    def test_neonatal_jaundice_emergency(self):
+    def test_neonatal_jaundice_emergency(self, clinical_scores):
         """Patient: 3-day newborn, severe jaundice → HIGH risk."""
-        j_score = jaundice_score_from_ratio(0.45)
-        j_sev = jaundice_severity(j_score)
+        j_sev = clinical_scores["jaundice_sev_0.45"]
 
         assert j_sev == "SEVERE"
         assert has_high_risk_indicators(jaundice_sev=j_sev) is True
@@ -384,15 +574,28 @@ class TestClinicalScenarios:
 # Summary table (for documentation / README embedding)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Constant layout pieces, built once at import instead of per call.
+_SEP90 = "=" * 90
+_SEP60 = "  " + "─" * 60
+_SEP70 = "  " + "─" * 70
+_COLS_PALLOR = f"  {'Saturation':<15} {'Severity':<12} Clinical Interpretation"
+_COLS_JAUNDICE = f"  {'Yellow Ratio':<15} {'Score':<8} {'Severity':<12} Clinical Interpretation"
+_COLS_EDEMA = f"  {'EAR Value':<15} {'Score':<8} {'Severity':<14} Clinical Interpretation"
+
+
 def print_validation_summary():
     """Print a formatted summary table of all sensor thresholds."""
-    print("\n" + "=" * 90)
-    print("NKU SENSOR VALIDATION — Clinical Threshold Summary")
-    print("=" * 90)
-
-    print(f"\n{'─── Pallor Detector (Conjunctival Saturation) ───':}")
-    print(f"  {'Saturation':<15} {'Severity':<12} {'Clinical Interpretation'}")
-    print(f"  {'─'*60}")
+    # Collect rows and flush once: one write syscall instead of one per print.
+    lines = [
+        "",
+        _SEP90,
+        "NKU SENSOR VALIDATION — Clinical Threshold Summary",
+        _SEP90,
+        "",
+        "─── Pallor Detector (Conjunctival Saturation) ───",
+        _COLS_PALLOR,
+        _SEP60,
+    ]
     for sat, expected_sev, interpretation in [
         (0.25, "NORMAL",   "Healthy conjunctiva, no anemia signs"),
         (0.15, "MILD",     "Slight pallor, consider iron studies"),
@@ -401,11 +604,10 @@ def print_validation_summary():
     ]:
         sev = pallor_severity(sat)
         status = "✅" if sev == expected_sev else "❌"
-        print(f"  {status} {sat:<14.2f} {sev:<12} {interpretation}")
+        lines.append(f"  {status} {sat:<14.2f} {sev:<12} {interpretation}")
 
-    print(f"\n{'─── Jaundice Detector (Scleral Yellow Ratio → Sigmoid) ───':}")
-    print(f"  {'Yellow Ratio':<15} {'Score':<8} {'Severity':<12} {'Clinical Interpretation'}")
-    print(f"  {'─'*70}")
+    lines += ["", "─── Jaundice Detector (Scleral Yellow Ratio → Sigmoid) ───",
+              _COLS_JAUNDICE, _SEP70]
     for ratio, expected_sev, interpretation in [
         (0.03, "NORMAL",   "Clear sclera, no bilirubin elevation"),
         (0.12, "MILD",     "Faint yellowing, subclinical or early jaundice"),
@@ -415,11 +617,9 @@ def print_validation_summary():
         score = jaundice_score_from_ratio(ratio)
         sev = jaundice_severity(score)
         status = "✅" if sev == expected_sev else "⚠️"
-        print(f"  {status} {ratio:<14.2f} {score:<7.2f}  {sev:<12} {interpretation}")
+        lines.append(f"  {status} {ratio:<14.2f} {score:<7.2f}  {sev:<12} {interpretation}")
 
-    print(f"\n{'─── Edema Detector (Eye Aspect Ratio) ───':}")
-    print(f"  {'EAR Value':<15} {'Score':<8} {'Severity':<14} {'Clinical Interpretation'}")
-    print(f"  {'─'*70}")
+    lines += ["", "─── Edema Detector (Eye Aspect Ratio) ───", _COLS_EDEMA, _SEP70]
     for ear, expected_sev, interpretation in [
         (2.8, "NORMAL",      "No periorbital swelling"),
         (2.3, "MILD",        "Slight puffiness, possibly fatigue/allergen"),
@@ -429,20 +629,24 @@ def print_validation_summary():
         score = edema_from_ear(ear)
         sev = edema_severity(score)
         status = "✅" if sev == expected_sev else "⚠️"
-        print(f"  {status} {ear:<14.1f} {score:<7.2f}  {sev:<14} {interpretation}")
-
-    print(f"\n{'─── Confidence Gating ───':}")
-    print(f"  Threshold: {CONFIDENCE_THRESHOLD}")
-    print(f"  Below threshold → sensor reading annotated as 'UNRELIABLE' in prompt")
-    print(f"  Above threshold → sensor reading used for clinical reasoning")
-
-    print(f"\n{'─── High Risk Danger Signs (WHO/IMCI) ───':}")
-    print(f"  HR > 130 or HR < 50 BPM → DANGER")
-    print(f"  Pallor SEVERE → DANGER")
-    print(f"  Jaundice SEVERE → DANGER")
-    print(f"  Edema SIGNIFICANT or SEVERE → DANGER")
-    print(f"  Respiratory Risk HIGH → DANGER")
-    print()
+        lines.append(f"  {status} {ear:<14.1f} {score:<7.2f}  {sev:<14} {interpretation}")
+
+    lines += [
+        "",
+        "─── Confidence Gating ───",
+        f"  Threshold: {CONFIDENCE_THRESHOLD}",
+        "  Below threshold → sensor reading annotated as 'UNRELIABLE' in prompt",
+        "  Above threshold → sensor reading used for clinical reasoning",
+        "",
+        "─── High Risk Danger Signs (WHO/IMCI) ───",
+        "  HR > 130 or HR < 50 BPM → DANGER",
+        "  Pallor SEVERE → DANGER",
+        "  Jaundice SEVERE → DANGER",
+        "  Edema SIGNIFICANT or SEVERE → DANGER",
+        "  Respiratory Risk HIGH → DANGER",
+        "",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
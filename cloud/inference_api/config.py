@@ -1,14 +1,19 @@
 """
 Nku Configuration Module
 Centralized, type-safe configuration with environment variable loading.
+
+This is the single config module for the cloud inference API. The unrelated
+src/config.py holds mobile/edge pipeline constants and is not a duplicate.
 """
 
 import os
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
     """Model configuration settings."""
     # D-04: Cloud uses Q2_K quantization (higher quality, ~1.6GB per model) because
@@ -36,16 +41,30 @@ class ModelConfig:
     n_batch: int = 512
     n_threads: int = 4
     n_gpu_layers: int = 0  # CPU-only for Cloud Run
+    # Optional quantization override (e.g. "Q4_K_M"). When set, the GGUF
+    # filenames are rewritten by convention — the quant token before .gguf
+    # is swapped in place — so operators can trade size for quality with a
+    # single env var instead of spelling out both filenames. An explicit
+    # MEDGEMMA_FILE / TRANSLATEGEMMA_FILE still wins.
+    quantization: Optional[str] = None
+
+    @classmethod
+    def for_deployment(cls, profile: str) -> 'ModelConfig':
+        """
+        Build a ModelConfig from a named deployment profile instead of
+        resolving repo/file strings from individual env vars.
+        """
+        return cls(**_model_profile(profile))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RateLimitConfig:
     """Rate limiting configuration."""
     requests_per_minute: int = 30
     requests_per_hour: int = 500
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SecurityConfig:
     """Security configuration."""
     allowed_origins: List[str] = field(default_factory=list)
@@ -54,7 +73,7 @@ class SecurityConfig:
     enable_rate_limiting: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InferenceConfig:
     """Inference behavior configuration."""
     translation_temperature: float = 0.3
@@ -63,7 +82,7 @@ class InferenceConfig:
     max_triage_tokens: int = 512
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Main application configuration."""
     # Environment
@@ -83,99 +102,206 @@ class AppConfig:
     def from_env(cls) -> 'AppConfig':
         """Load configuration from environment variables."""
 
+        # Bind the lookup once: LOAD_FAST per call instead of resolving
+        # os.environ.get three attribute hops at a time, ~20 times over.
+        env_get = os.environ.get
+
+        def section(name: str) -> dict:
+            values = {}
+            for env_name, field_name, cast, default in _ENV_SPEC[name]:
+                value = env_get(env_name, default)
+                values[field_name] = cast(value) if cast else value
+            return values
+
         # Parse allowed origins from comma-separated list
-        allowed_origins_str = os.environ.get('ALLOWED_ORIGINS', '')
+        allowed_origins_str = env_get('ALLOWED_ORIGINS', '')
         allowed_origins = [o.strip() for o in allowed_origins_str.split(',') if o.strip()]
-        default_model = ModelConfig()
+
+        model_kwargs = section('model')
+        explicit = {f for name, f, _, _ in _ENV_SPEC['model'] if name in os.environ}
+        profile = env_get('NKU_PROFILE')
+        if profile:
+            # Profile supplies the repo/file defaults; explicitly set env
+            # vars still win over the profile.
+            for field_name, value in _model_profile(profile).items():
+                if field_name not in explicit:
+                    model_kwargs[field_name] = value
+
+        # Quantization override: rewrite the GGUF filenames by convention
+        # unless the operator pinned a filename explicitly.
+        quantization = model_kwargs.get('quantization')
+        if quantization:
+            for file_field in ('medgemma_file', 'translategemma_file'):
+                if file_field not in explicit:
+                    model_kwargs[file_field] = _requantize_filename(
+                        model_kwargs[file_field], quantization
+                    )
 
         return cls(
-            env=os.environ.get('APP_ENV', 'production'),
-            debug=os.environ.get('DEBUG', '').lower() == 'true',
-            port=int(os.environ.get('PORT', 8080)),
-            log_level=os.environ.get('LOG_LEVEL', 'INFO'),
-            log_json=os.environ.get('LOG_JSON', 'true').lower() == 'true',
-
-            model=ModelConfig(
-                medgemma_repo=os.environ.get('MEDGEMMA_REPO', default_model.medgemma_repo),
-                medgemma_file=os.environ.get('MEDGEMMA_FILE', default_model.medgemma_file),
-                medgemma_revision=os.environ.get('MEDGEMMA_REVISION', default_model.medgemma_revision),
-                medgemma_sha256=os.environ.get('MEDGEMMA_SHA256', default_model.medgemma_sha256),
-                translategemma_repo=os.environ.get('TRANSLATEGEMMA_REPO', default_model.translategemma_repo),
-                translategemma_file=os.environ.get('TRANSLATEGEMMA_FILE', default_model.translategemma_file),
-                translategemma_revision=os.environ.get('TRANSLATEGEMMA_REVISION', default_model.translategemma_revision),
-                translategemma_sha256=os.environ.get('TRANSLATEGEMMA_SHA256', default_model.translategemma_sha256),
-                context_size=int(os.environ.get('MODEL_CONTEXT_SIZE', default_model.context_size)),
-                n_batch=int(os.environ.get('MODEL_BATCH', default_model.n_batch)),
-                n_threads=int(os.environ.get('MODEL_THREADS', default_model.n_threads)),
-                n_gpu_layers=int(os.environ.get('MODEL_GPU_LAYERS', default_model.n_gpu_layers)),
-            ),
-
-            rate_limit=RateLimitConfig(
-                requests_per_minute=int(os.environ.get('RATE_LIMIT_PER_MINUTE', 30)),
-                requests_per_hour=int(os.environ.get('RATE_LIMIT_PER_HOUR', 500)),
-            ),
-
-            security=SecurityConfig(
-                allowed_origins=allowed_origins,
-                max_text_length=int(os.environ.get('MAX_TEXT_LENGTH', 2000)),
-                max_symptom_length=int(os.environ.get('MAX_SYMPTOM_LENGTH', 1000)),
-                enable_rate_limiting=os.environ.get('ENABLE_RATE_LIMITING', 'true').lower() == 'true',
-            ),
-
-            inference=InferenceConfig(
-                translation_temperature=float(os.environ.get('TRANSLATION_TEMPERATURE', 0.3)),
-                triage_temperature=float(os.environ.get('TRIAGE_TEMPERATURE', 0.2)),
-                max_translation_tokens=int(os.environ.get('MAX_TRANSLATION_TOKENS', 256)),
-                max_triage_tokens=int(os.environ.get('MAX_TRIAGE_TOKENS', 512)),
-            ),
+            model=ModelConfig(**model_kwargs),
+            rate_limit=RateLimitConfig(**section('rate_limit')),
+            security=SecurityConfig(allowed_origins=allowed_origins, **section('security')),
+            inference=InferenceConfig(**section('inference')),
+            **section('app'),
         )
 
 
-# Medical glossary for accurate translation
-MEDICAL_GLOSSARY = """
-Twi Medical Terms (use exactly as provided):
-- tirim yɛ me ya = headache (head pain)
-- me yafun yɛ me ya = stomach pain
-- me ho hyehye me = fever (body is hot)
-- me bo me fu = nausea
-- ahoma/mframa guan = malaria symptoms
-- me ani so awu = dizziness/vision problems
-- me ho yɛ me yaw = body aches
-- me mene ahoma = difficulty breathing
-- mogya kɔ soro = high blood pressure (hypertension)
-- mogya si fam = low blood pressure (hypotension)
-- me koma bɔ ntɛm = rapid heartbeat (palpitations)
-- me koma bɔ brɛoo = slow heartbeat (bradycardia)
-- me ho nkumso = swelling/edema
-- me ho ani pa = pallor/anemia signs
-- ɛwa me = cough (persistent)
-- me kokom ye me ya = chest pain
-- me ase yɛ me ka = lower abdominal pain (pelvic)
-- awo mu haw = pregnancy complications
-- awo yɛ me ya = labour pains/contractions
-- mogya firi me so = bleeding (haemorrhage)
-- yareɛ a ɛhyɛ mu = infection/sepsis
-- kɔ OPD = go to outpatient department (referral)
-"""
+# Deployment profiles: precomputed ModelConfig overrides keyed by a single
+# name, so switching targets does not mean editing six env vars. The class
+# defaults (pinned mradermacher Q2_K) are the cloud profile. The wredd
+# conversions carry no pinned revision — the default SHA belongs to the
+# mradermacher repo only.
+_MODEL_PROFILES = {
+    'cloud_q2k': {},
+    'mobile_iq1m': dict(
+        medgemma_repo='wredd/medgemma-4b-gguf',
+        medgemma_file='medgemma-4b-iq1_m.gguf',
+        medgemma_revision=None,
+        translategemma_repo='wredd/translategemma-4b-gguf',
+        translategemma_file='translategemma-4b-iq1_m.gguf',
+        translategemma_revision=None,
+    ),
+    'edge_q2k': dict(
+        medgemma_repo='wredd/medgemma-4b-gguf',
+        medgemma_file='medgemma-4b-q2_k.gguf',
+        medgemma_revision=None,
+        translategemma_repo='wredd/translategemma-4b-gguf',
+        translategemma_file='translategemma-4b-q2_k.gguf',
+        translategemma_revision=None,
+    ),
+}
+
+
+# Quantization token immediately before the .gguf suffix, in either the
+# mradermacher style ("medgemma-4b-it.Q2_K.gguf") or the wredd style
+# ("medgemma-4b-q2_k.gguf").
+_QUANT_TOKEN_RE = re.compile(r'(?:IQ|Q)\d+(?:_[A-Z0-9]+)*(?=\.gguf$)', re.IGNORECASE)
+
+
+def _requantize_filename(filename: str, quantization: str) -> str:
+    """Swap the quantization token in a GGUF filename, preserving its case style."""
+    match = _QUANT_TOKEN_RE.search(filename)
+    if match is None:
+        raise ValueError(
+            f"Cannot derive a {quantization} filename from {filename!r}: "
+            f"no quantization token before .gguf"
+        )
+    token = quantization.upper() if match.group().isupper() else quantization.lower()
+    return f'{filename[:match.start()]}{token}{filename[match.end():]}'
+
+
+def _model_profile(profile: str) -> dict:
+    """Look up a deployment profile, raising a helpful error on a typo."""
+    try:
+        return _MODEL_PROFILES[profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown deployment profile {profile!r} "
+            f"(expected one of {sorted(_MODEL_PROFILES)})"
+        ) from None
+
+
+def _env_bool(value) -> bool:
+    """Parse a 'true'/'false' environment value."""
+    return str(value).lower() == 'true'
+
+
+_MODEL_DEFAULTS = ModelConfig()
+
+# Declarative env-var surface: one (env var, field, cast, default) row per
+# setting, grouped by the sub-config it feeds. from_env walks these tables in
+# a single pass instead of spelling out a get/cast statement per field. A cast
+# of None passes the value through unchanged (needed for Optional defaults).
+_ENV_SPEC = {
+    'app': (
+        ('APP_ENV', 'env', None, 'production'),
+        ('DEBUG', 'debug', _env_bool, ''),
+        ('PORT', 'port', int, 8080),
+        ('LOG_LEVEL', 'log_level', None, 'INFO'),
+        ('LOG_JSON', 'log_json', _env_bool, 'true'),
+    ),
+    'model': (
+        ('MEDGEMMA_REPO', 'medgemma_repo', None, _MODEL_DEFAULTS.medgemma_repo),
+        ('MEDGEMMA_FILE', 'medgemma_file', None, _MODEL_DEFAULTS.medgemma_file),
+        ('MEDGEMMA_REVISION', 'medgemma_revision', None, _MODEL_DEFAULTS.medgemma_revision),
+        ('MEDGEMMA_SHA256', 'medgemma_sha256', None, _MODEL_DEFAULTS.medgemma_sha256),
+        ('TRANSLATEGEMMA_REPO', 'translategemma_repo', None, _MODEL_DEFAULTS.translategemma_repo),
+        ('TRANSLATEGEMMA_FILE', 'translategemma_file', None, _MODEL_DEFAULTS.translategemma_file),
+        ('TRANSLATEGEMMA_REVISION', 'translategemma_revision', None, _MODEL_DEFAULTS.translategemma_revision),
+        ('TRANSLATEGEMMA_SHA256', 'translategemma_sha256', None, _MODEL_DEFAULTS.translategemma_sha256),
+        ('MODEL_CONTEXT_SIZE', 'context_size', int, _MODEL_DEFAULTS.context_size),
+        ('MODEL_BATCH', 'n_batch', int, _MODEL_DEFAULTS.n_batch),
+        ('MODEL_THREADS', 'n_threads', int, _MODEL_DEFAULTS.n_threads),
+        ('MODEL_GPU_LAYERS', 'n_gpu_layers', int, _MODEL_DEFAULTS.n_gpu_layers),
+        ('MODEL_QUANTIZATION', 'quantization', None, _MODEL_DEFAULTS.quantization),
+    ),
+    'rate_limit': (
+        ('RATE_LIMIT_PER_MINUTE', 'requests_per_minute', int, 30),
+        ('RATE_LIMIT_PER_HOUR', 'requests_per_hour', int, 500),
+    ),
+    'security': (
+        ('MAX_TEXT_LENGTH', 'max_text_length', int, 2000),
+        ('MAX_SYMPTOM_LENGTH', 'max_symptom_length', int, 1000),
+        ('ENABLE_RATE_LIMITING', 'enable_rate_limiting', _env_bool, 'true'),
+    ),
+    'inference': (
+        ('TRANSLATION_TEMPERATURE', 'translation_temperature', float, 0.3),
+        ('TRIAGE_TEMPERATURE', 'triage_temperature', float, 0.2),
+        ('MAX_TRANSLATION_TOKENS', 'max_translation_tokens', int, 256),
+        ('MAX_TRIAGE_TOKENS', 'max_triage_tokens', int, 512),
+    ),
+}
+
+
+# Medical glossary for accurate translation.
+# Structured dict first: translation code gets O(1) term lookups, and the
+# prompt-ready MEDICAL_GLOSSARY string below is derived from it once at import
+# instead of every caller re-scanning a multiline literal.
+MEDICAL_GLOSSARY_DICT = {
+    "tirim yɛ me ya": "headache (head pain)",
+    "me yafun yɛ me ya": "stomach pain",
+    "me ho hyehye me": "fever (body is hot)",
+    "me bo me fu": "nausea",
+    "ahoma/mframa guan": "malaria symptoms",
+    "me ani so awu": "dizziness/vision problems",
+    "me ho yɛ me yaw": "body aches",
+    "me mene ahoma": "difficulty breathing",
+    "mogya kɔ soro": "high blood pressure (hypertension)",
+    "mogya si fam": "low blood pressure (hypotension)",
+    "me koma bɔ ntɛm": "rapid heartbeat (palpitations)",
+    "me koma bɔ brɛoo": "slow heartbeat (bradycardia)",
+    "me ho nkumso": "swelling/edema",
+    "me ho ani pa": "pallor/anemia signs",
+    "ɛwa me": "cough (persistent)",
+    "me kokom ye me ya": "chest pain",
+    "me ase yɛ me ka": "lower abdominal pain (pelvic)",
+    "awo mu haw": "pregnancy complications",
+    "awo yɛ me ya": "labour pains/contractions",
+    "mogya firi me so": "bleeding (haemorrhage)",
+    "yareɛ a ɛhyɛ mu": "infection/sepsis",
+    "kɔ OPD": "go to outpatient department (referral)",
+}
 
+MEDICAL_GLOSSARY = (
+    "\nTwi Medical Terms (use exactly as provided):\n"
+    + "\n".join(f"- {term} = {meaning}" for term, meaning in MEDICAL_GLOSSARY_DICT.items())
+    + "\n"
+)
 
-# Singleton config instance
-_config: Optional[AppConfig] = None
+# Kept for callers that iterate (term, meaning) pairs.
+MEDICAL_GLOSSARY_ENTRIES = tuple(MEDICAL_GLOSSARY_DICT.items())
 
 
+@lru_cache(maxsize=1)
 def get_config() -> AppConfig:
     """Get the application configuration singleton."""
-    global _config
-    if _config is None:
-        _config = AppConfig.from_env()
-    return _config
+    return AppConfig.from_env()
 
 
 def reload_config() -> AppConfig:
     """Force reload configuration from environment."""
-    global _config
-    _config = AppConfig.from_env()
-    return _config
+    get_config.cache_clear()
+    return get_config()
 
 
 __all__ = [
@@ -187,4 +313,6 @@ __all__ = [
     'get_config',
     'reload_config',
     'MEDICAL_GLOSSARY',
+    'MEDICAL_GLOSSARY_DICT',
+    'MEDICAL_GLOSSARY_ENTRIES',
 ]
@@ -3,26 +3,89 @@ Nku Logging Configuration
 Provides structured JSON logging with request correlation IDs.
 """
 
+import atexit
 import logging
+import logging.handlers
 import json
+import os
+import queue
+import re
 import sys
-import uuid
 import time
-from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 from functools import wraps
 from contextvars import ContextVar
 
+from flask import request, g
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is pinned in the API requirements.txt
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj: Dict[str, Any]) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+else:
+    _dumps = json.dumps
+
 # Context variable for request correlation
 request_id_var: ContextVar[Optional[str]] = ContextVar('request_id', default=None)
 
+# Accepted shape for caller-supplied X-Request-ID values; anything else is
+# replaced with a generated ID so untrusted bytes never reach the logs.
+_REQUEST_ID_RE = re.compile(r'[A-Za-z0-9-]{1,64}')
+
+
+# Per-second timestamp cache: (int(record.created), formatted prefix).
+# Assignment of the tuple is atomic, so a benign race just reformats once.
+_ts_cache = (0, '')
+
+
+def _format_timestamp(record: logging.LogRecord) -> str:
+    """UTC ISO-8601 timestamp from record.created, millisecond precision.
+
+    strftime runs once per wall-clock second; within a second only the
+    millisecond suffix is appended. Uses the record's own creation time
+    rather than a second clock read in the formatter.
+    """
+    global _ts_cache
+    whole = int(record.created)
+    cached_second, prefix = _ts_cache
+    if whole != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(whole))
+        _ts_cache = (whole, prefix)
+    return f'{prefix}.{int(record.msecs):03d}Z'
+
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
 
     def format(self, record: logging.LogRecord) -> str:
+        # Queue-delivered records carry the ID captured on the request
+        # thread; the ContextVar fallback covers direct (synchronous) use.
+        request_id = getattr(record, 'request_id', None) or request_id_var.get()
+
+        # Fast path: the common record has no exception, stack info, or
+        # extra fields, so the JSON is spliced from static fragments.
+        # Only the message (arbitrary text) and funcName (may be None on
+        # synthesized records) go through the serializer; level, logger,
+        # and module are identifiers and request IDs are generated hex.
+        if not (record.exc_info or record.stack_info
+                or hasattr(record, 'extra_data')):
+            rid = f',"request_id":"{request_id}"' if request_id else ''
+            return (
+                f'{{"timestamp":"{_format_timestamp(record)}"'
+                f',"level":"{record.levelname}"'
+                f',"logger":"{record.name}"'
+                f',"message":{_dumps(record.getMessage())}'
+                f',"module":"{record.module}"'
+                f',"function":{_dumps(record.funcName)}'
+                f',"line":{record.lineno}{rid}}}'
+            )
+
         log_data = {
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': _format_timestamp(record),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -32,7 +95,6 @@ class JSONFormatter(logging.Formatter):
         }
 
         # Add request ID if available
-        request_id = request_id_var.get()
         if request_id:
             log_data['request_id'] = request_id
 
@@ -52,7 +114,7 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, 'extra_data'):
             log_data.update(record.extra_data)
 
-        return json.dumps(log_data)
+        return _dumps(log_data)
 
 
 class RequestLogger:
@@ -61,7 +123,16 @@ class RequestLogger:
     def __init__(self, logger: logging.Logger):
         self.logger = logger
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Expose the underlying logger's level check for callers that
+        want to skip building expensive log arguments."""
+        return self.logger.isEnabledFor(level)
+
     def _log(self, level: int, message: str, extra_data: Dict[str, Any] = None, exc_info=None):
+        # Skip makeRecord/handle entirely for disabled levels (e.g. debug()
+        # calls in production) — the stock Logger does the same gate.
+        if not self.logger.isEnabledFor(level):
+            return
         record = self.logger.makeRecord(
             self.logger.name, level, '', 0, message, (), exc_info
         )
@@ -82,8 +153,77 @@ class RequestLogger:
         self._log(logging.DEBUG, message, kwargs if kwargs else None)
 
 
+class _BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that flushes at most once per FLUSH_INTERVAL.
+
+    The stock emit() flushes after every record, forcing a syscall per log
+    line. Here writes accumulate in the stream's own buffer and are flushed
+    on a throttle; WARNING and above flush immediately so errors are never
+    stuck in the buffer. logging.shutdown() flushes on interpreter exit,
+    and _stop_listener() flushes when logging is reconfigured.
+    """
+
+    FLUSH_INTERVAL = 1.0  # seconds between forced flushes for INFO/DEBUG
+
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self._last_flush = 0.0
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            now = time.monotonic()
+            if (record.levelno >= logging.WARNING
+                    or now - self._last_flush >= self.FLUSH_INTERVAL):
+                self._last_flush = now
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _PassthroughQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records unchanged.
+
+    The stock prepare() pre-formats the record and drops exc_info/stack_info
+    so records can cross process boundaries. Our listener runs in-process, so
+    we skip that work and let JSONFormatter see the original record. The
+    request ID is captured here because ContextVars set on the request
+    thread are not visible from the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.request_id = request_id_var.get()
+        return record
+
+
+# Active QueueListener, stopped and replaced on each setup_logging() call.
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_listener():
+    global _queue_listener
+    if _queue_listener is not None:
+        listener, _queue_listener = _queue_listener, None
+        listener.stop()
+        for handler in listener.handlers:
+            try:
+                handler.flush()
+            except ValueError:
+                pass  # stream already closed during interpreter shutdown
+
+
+atexit.register(_stop_listener)
+
+
 def setup_logging(level: str = 'INFO', json_format: bool = True) -> logging.Logger:
-    """Configure application logging."""
+    """Configure application logging.
+
+    Formatting and I/O run on a background QueueListener thread so the
+    request thread only pays for an unbounded-queue put per log call.
+    """
+    global _queue_listener
 
     log_level = getattr(logging, level.upper(), logging.INFO)
 
@@ -91,11 +231,12 @@ def setup_logging(level: str = 'INFO', json_format: bool = True) -> logging.Logg
     logger = logging.getLogger('nku')
     logger.setLevel(log_level)
 
-    # Remove existing handlers
+    # Remove existing handlers (and any listener draining for them)
+    _stop_listener()
     logger.handlers.clear()
 
-    # Create console handler
-    handler = logging.StreamHandler(sys.stdout)
+    # Create console handler (runs on the listener thread)
+    handler = _BufferedStreamHandler(sys.stdout)
     handler.setLevel(log_level)
 
     if json_format:
@@ -105,7 +246,13 @@ def setup_logging(level: str = 'INFO', json_format: bool = True) -> logging.Logg
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         ))
 
-    logger.addHandler(handler)
+    log_queue: 'queue.SimpleQueue[logging.LogRecord]' = queue.SimpleQueue()
+    logger.addHandler(_PassthroughQueueHandler(log_queue))
+
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, handler, respect_handler_level=True
+    )
+    _queue_listener.start()
 
     return logger
 
@@ -115,19 +262,24 @@ def log_request(logger: logging.Logger):
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            from flask import request, g
-
-            # Generate request ID
-            request_id = str(uuid.uuid4())[:8]
+            # Honor a well-formed caller-supplied correlation ID, otherwise
+            # generate one. os.urandom(4).hex() gives the same 8 hex chars
+            # as the old uuid4 slice without UUID object construction.
+            request_id = request.headers.get('X-Request-ID')
+            if not (request_id and _REQUEST_ID_RE.fullmatch(request_id)):
+                request_id = os.urandom(4).hex()
             request_id_var.set(request_id)
             g.request_id = request_id
             g.request_start = time.time()
 
-            # Log request
-            logger.info(f"Request started: {request.method} {request.path}", extra={
+            # Log request — method/path/remote_addr are werkzeug properties
+            # that re-parse the WSGI environ, so read each exactly once.
+            method = request.method
+            path = request.path
+            logger.info(f"Request started: {method} {path}", extra={
                 'extra_data': {
-                    'method': request.method,
-                    'path': request.path,
+                    'method': method,
+                    'path': path,
                     'client_ip': request.remote_addr,
                     'user_agent': request.headers.get('User-Agent', '')[:100]
                 }
@@ -153,13 +305,13 @@ def log_request(logger: logging.Logger):
                 return response
 
             except Exception as e:
-                import traceback
                 duration_ms = (time.time() - g.request_start) * 1000
+                # exc_info=True carries the traceback; JSONFormatter renders
+                # it once, so no eager traceback.format_exc() duplicate.
                 logger.error(f"Request failed: {str(e)}", exc_info=True, extra={
                     'extra_data': {
                         'error': str(e),
                         'error_type': type(e).__name__,
-                        'traceback': traceback.format_exc(),
                         'duration_ms': round(duration_ms, 2)
                     }
                 })
@@ -17,11 +17,14 @@ SECURITY NOTES:
 - Structured logging for observability
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify, stream_with_context
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import wraps
 from typing import Optional, Tuple
 import os
-import traceback
+import queue
+import sys
+import time
 import threading
 import signal
 import hashlib
@@ -47,6 +50,11 @@ try:
 except ImportError:
     Llama = None  # Allow running tests without native library
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is pinned in the API requirements.txt
+    orjson = None
+
 # Local modules — support both direct execution and package import
 try:
     from config import get_config, MEDICAL_GLOSSARY
@@ -54,22 +62,20 @@ try:
         InputValidator,
         PromptProtector,
         RateLimiter,
-        rate_limit,
         configure_cors,
-        validate_json_request
+        _translation_scaffold
     )
-    from logging_config import setup_logging, log_request, get_logger
+    from logging_config import setup_logging, log_request, get_logger, request_id_var
 except ImportError:
     from .config import get_config, MEDICAL_GLOSSARY
     from .security import (
         InputValidator,
         PromptProtector,
         RateLimiter,
-        rate_limit,
         configure_cors,
-        validate_json_request
+        _translation_scaffold
     )
-    from .logging_config import setup_logging, log_request, get_logger
+    from .logging_config import setup_logging, log_request, get_logger, request_id_var
 
 
 # =============================================================================
@@ -77,6 +83,22 @@ except ImportError:
 # =============================================================================
 
 app = Flask(__name__)
+
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """JSON provider backed by orjson, so jsonify and request.get_json
+        use the C serializer instead of stdlib json."""
+
+        def dumps(self, obj, **kwargs) -> str:
+            return orjson.dumps(obj).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
 config = get_config()
 
 # F-007: Enforce MAX_CONTENT_LENGTH at the Flask/Werkzeug layer for early rejection
@@ -91,6 +113,10 @@ configure_cors(app, allowed_origins=config.security.allowed_origins)
 
 # Initialize security components
 input_validator = InputValidator()
+
+# Canonical language codes: requests that already send a lowercase member
+# of the allow-list skip the validate_language strip/lower/length pass.
+_VALID_LANGS = frozenset(InputValidator.ALLOWED_LANGUAGES)
 rate_limiter = RateLimiter(
     requests_per_minute=config.rate_limit.requests_per_minute,
     requests_per_hour=config.rate_limit.requests_per_hour
@@ -104,6 +130,11 @@ _model_lock = threading.Lock()
 medgemma: Optional[Llama] = None
 translategemma: Optional[Llama] = None
 
+# Set once both models are resident; lets the steady-state load_models call
+# return on a single Event check instead of re-deriving the shared-config
+# aliasing and per-model None checks on every request.
+_models_ready = threading.Event()
+
 # C-6 fix: Warn at startup if TranslateGemma defaults to MedGemma
 if config.model.translategemma_repo == config.model.medgemma_repo \
         and config.model.translategemma_file == config.model.medgemma_file:
@@ -117,55 +148,36 @@ if config.model.translategemma_repo == config.model.medgemma_repo \
 # SECURITY HEADERS (S-06)
 # =============================================================================
 
+# Static header set applied to every response; built once so after_request
+# does a single extend instead of six __setitem__ calls.
+_SECURITY_HEADERS = (
+    ('X-Content-Type-Options', 'nosniff'),
+    ('X-Frame-Options', 'DENY'),
+    ('X-XSS-Protection', '1; mode=block'),
+    ('Strict-Transport-Security', 'max-age=31536000; includeSubDomains'),
+    ('Content-Security-Policy', "default-src 'none'; frame-ancestors 'none'"),
+    ('Referrer-Policy', 'no-referrer'),
+)
+
+
 @app.after_request
 def add_security_headers(response):
     """Add security headers to all responses."""
-    response.headers['X-Content-Type-Options'] = 'nosniff'
-    response.headers['X-Frame-Options'] = 'DENY'
-    response.headers['X-XSS-Protection'] = '1; mode=block'
-    response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
-    response.headers['Content-Security-Policy'] = "default-src 'none'; frame-ancestors 'none'"
-    response.headers['Referrer-Policy'] = 'no-referrer'
+    response.headers.extend(_SECURITY_HEADERS)
+    # Echo the correlation ID so clients can match responses to log lines
+    request_id = g.get('request_id')
+    if request_id:
+        response.headers['X-Request-ID'] = request_id
     return response
 
 
-def require_api_key(f):
-    """Decorator: require NKU_API_KEY header (S-04).
-
-    Finding 14 fix: In production (debug=False), if NKU_API_KEY is not
-    configured, ALL requests are denied — preventing accidental open endpoints.
-    In debug mode, missing key is tolerated for local development.
-    """
-    @wraps(f)
-    def decorated(*args, **kwargs):
-        if _api_key:
-            provided = request.headers.get('X-API-Key', '')
-            if provided != _api_key:
-                return jsonify({
-                    'error': 'unauthorized',
-                    'message': 'Invalid or missing API key'
-                }), 401
-        elif not config.debug:
-            # Finding 14: No API key configured in production — deny all
-            return jsonify({
-                'error': 'misconfigured',
-                'message': 'API key not configured. Set NKU_API_KEY environment variable.'
-            }), 503
-        return f(*args, **kwargs)
-    return decorated
-
-
 # =============================================================================
 # ERROR HANDLING
 # =============================================================================
 
 def _get_request_id() -> str:
     """Get request correlation ID from logging context (B-04)."""
-    try:
-        from logging_config import request_id_var
-        return request_id_var.get() or 'unknown'
-    except Exception:
-        return 'unknown'
+    return request_id_var.get() or 'unknown'
 
 
 @app.errorhandler(Exception)
@@ -176,9 +188,11 @@ def handle_exception(e):
     if isinstance(e, HTTPException):
         return e
 
+    # exc_info lets the formatter render the traceback once, and only if
+    # the record is actually emitted (no eager format_exc() string).
     request_logger.error(f"Unhandled exception: {str(e)}",
-                         error_type=type(e).__name__,
-                         traceback=traceback.format_exc())
+                         exc_info=sys.exc_info(),
+                         error_type=type(e).__name__)
 
     # Don't expose internal errors in production (B-04: include request_id)
     rid = _get_request_id()
@@ -208,11 +222,8 @@ def handle_bad_request(e):
 
 @app.errorhandler(429)
 def handle_rate_limit(e):
-    return jsonify({
-        'error': 'rate_limit_exceeded',
-        'message': 'Too many requests. Please slow down.',
-        'request_id': _get_request_id()
-    }), 429
+    body = _RATE_LIMIT_PREFIX + _get_request_id().encode('ascii') + b'"}'
+    return _static_error(body, 429)
 
 
 # =============================================================================
@@ -303,6 +314,217 @@ def _verify_model_hash(file_path: str, expected_sha256: Optional[str]) -> bool:
     return True
 
 
+# Sentinel marking the end of a streaming inference's chunk queue.
+_STREAM_DONE = object()
+
+
+class _InferenceWorker:
+    """Serialized inference queue for one model role.
+
+    Request threads submit (prompt, params) and block on a Future instead
+    of calling the Llama object directly. A single daemon thread per model
+    drains the queue, so concurrent requests stop contending for the GIL
+    inside llama.cpp's C loop and are served FIFO with explicit timeouts
+    (queued work past its deadline fails fast instead of piling up).
+    llama-cpp-python's high-level API decodes one sequence at a time, so
+    this serializes rather than batches; the queue is the insertion point
+    for multi-sequence batching if the bindings grow support for it.
+    """
+
+    def __init__(self, role: str):
+        self.role = role
+        self._queue: 'queue.SimpleQueue' = queue.SimpleQueue()
+        # Token lists for constant template fragments, keyed by
+        # (model id, fragment) — token ids are tokenizer-specific, and
+        # the model global can be swapped by a reload.
+        self._fragment_tokens: dict = {}
+        self._thread = threading.Thread(
+            target=self._loop, daemon=True, name=f'nku-{role}-worker'
+        )
+        self._thread.start()
+
+    def submit(self, prompt: str, **params) -> Future:
+        future: Future = Future()
+        self._queue.put((future, None, prompt, params))
+        return future
+
+    def pending(self) -> int:
+        """Jobs currently waiting in this worker's queue (for /metrics)."""
+        return self._queue.qsize()
+
+    def __call__(self, prompt: str, **params):
+        """Run one inference on the worker thread and wait for the result."""
+        deadline = g.get('inference_deadline')
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0.1)
+        return self.submit(prompt, **params).result(timeout=timeout)
+
+    def iter_stream(self, prompt: str, **params):
+        """Run one streaming inference, yielding text chunks as decoded.
+
+        The worker thread drains the model's stream=True generator and
+        relays chunks through a per-request queue, so decode stays
+        serialized on the worker while the caller forwards tokens to the
+        client. A worker-side exception is re-raised here once the
+        stream ends; each chunk wait is bounded by the request deadline.
+        """
+        deadline = g.get('inference_deadline')
+        sink: 'queue.SimpleQueue' = queue.SimpleQueue()
+        future: Future = Future()
+        self._queue.put((future, sink, prompt, params))
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0.1)
+            item = sink.get(timeout=timeout)
+            if item is _STREAM_DONE:
+                break
+            yield item['choices'][0]['text']
+        future.result(timeout=0)  # surface worker-side failures
+
+    def _assemble_prompt(self, model, parts):
+        """Turn a (prefix, user_text, suffix) prompt into model input.
+
+        For a real Llama instance the constant prefix and suffix are
+        tokenized once per model and cached, so per request only the
+        short user text hits the SentencePiece tokenizer; the
+        concatenated token list goes straight into the C API. User text
+        is tokenized with special=False, so it cannot smuggle control
+        tokens. Anything that is not a Llama (mocks, test doubles) gets
+        the plain joined string.
+        """
+        prefix, user_text, suffix = parts
+        if Llama is None or not isinstance(model, Llama):
+            return prefix + user_text + suffix
+        cache = self._fragment_tokens
+        key = (id(model), prefix)
+        prefix_tokens = cache.get(key)
+        if prefix_tokens is None:
+            prefix_tokens = model.tokenize(
+                prefix.encode('utf-8'), add_bos=True, special=True
+            )
+            cache[key] = prefix_tokens
+        key = (id(model), suffix)
+        suffix_tokens = cache.get(key)
+        if suffix_tokens is None:
+            suffix_tokens = model.tokenize(
+                suffix.encode('utf-8'), add_bos=False, special=True
+            )
+            cache[key] = suffix_tokens
+        user_tokens = model.tokenize(
+            user_text.encode('utf-8'), add_bos=False, special=False
+        )
+        return prefix_tokens + user_tokens + suffix_tokens
+
+    def _loop(self):
+        while True:
+            future, sink, prompt, params = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue  # caller gave up while queued
+            # Resolve the model late so reloads (and test patches) of the
+            # module globals are picked up per job.
+            model = globals()[self.role]
+            try:
+                if isinstance(prompt, tuple):
+                    prompt = self._assemble_prompt(model, prompt)
+                if sink is None:
+                    future.set_result(model(prompt, **params))
+                else:
+                    for chunk in model(prompt, stream=True, **params):
+                        sink.put(chunk)
+                    future.set_result(None)
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                if sink is not None:
+                    sink.put(_STREAM_DONE)
+
+
+_translation_worker = _InferenceWorker('translategemma')
+_triage_worker = _InferenceWorker('medgemma')
+
+
+def _enable_prompt_cache(model) -> None:
+    """Attach an in-RAM KV cache to a loaded Llama instance.
+
+    Every /translate and /nku-cycle prompt opens with the same static
+    template and glossary prefix; with a cache attached, llama.cpp reuses
+    the evaluated KV state for the longest matching prefix instead of
+    re-ingesting those tokens on each request. Best-effort: older
+    llama-cpp-python builds without LlamaRAMCache just skip it.
+    """
+    try:
+        from llama_cpp import LlamaRAMCache
+        # 256 MiB holds several full-context KV states at Q2_K sizes
+        # without threatening the container's model memory budget.
+        model.set_cache(LlamaRAMCache(capacity_bytes=256 * 1024 * 1024))
+    except Exception as e:
+        request_logger.warning(f"Prompt KV cache unavailable: {e}")
+
+
+def _detect_gpu() -> bool:
+    """Best-effort CUDA probe without importing an ML framework."""
+    import ctypes
+    for lib in ('libcuda.so.1', 'libcuda.so'):
+        try:
+            ctypes.CDLL(lib)
+            return True
+        except OSError:
+            continue
+    return False
+
+
+_HAS_GPU = _detect_gpu()
+
+
+def _load_model_artifact(repo: str, filename: str, revision: Optional[str],
+                         expected_sha256: Optional[str], label: str) -> 'Llama':
+    """Download, verify, and construct one Llama instance.
+
+    Runs on a loader thread when both models are needed, so the two
+    downloads and weight loads overlap instead of running back to back.
+    """
+    request_logger.info(f"Downloading {label}...")
+    # B-07: Explicitly pass token — deploy.sh may set HUGGINGFACE_TOKEN
+    # but huggingface_hub expects HF_TOKEN. Support both.
+    hf_token = os.environ.get('HF_TOKEN') or os.environ.get('HUGGINGFACE_TOKEN')
+    model_path = hf_hub_download(  # nosec B615 — revision pinned via config
+        repo,
+        filename,
+        revision=revision,
+        token=hf_token
+    )
+    # Sanity check: a quantization/filename mixup shows up immediately as a
+    # wildly wrong artifact size in the logs.
+    size_mb = os.path.getsize(model_path) / (1024 * 1024)
+    request_logger.info(f"{label} artifact {filename}: {size_mb:.0f} MiB")
+
+    if not _verify_model_hash(model_path, expected_sha256):
+        raise RuntimeError(f"{label} model integrity verification failed (SHA-256 mismatch).")
+
+    model_kwargs = dict(
+        model_path=model_path,
+        n_ctx=config.model.context_size,
+        n_gpu_layers=config.model.n_gpu_layers,
+        n_threads=config.model.n_threads,
+        verbose=False
+    )
+    if _HAS_GPU:
+        # With a GPU present, partial offload leaves layers on CPU and
+        # serializes the forward pass across the PCIe boundary. Force full
+        # offload, a larger prefill batch, fused flash attention, and KV
+        # residency in VRAM.
+        model_kwargs.update(
+            n_gpu_layers=-1,
+            n_batch=512,
+            flash_attn=True,
+            offload_kqv=True,
+        )
+        request_logger.info(f"{label}: CUDA detected — full GPU offload enabled")
+
+    model = Llama(**model_kwargs)
+    _enable_prompt_cache(model)
+    request_logger.info(f"{label} loaded successfully")
+    return model
+
+
 def load_models(
     require_medgemma: bool = True,
     require_translategemma: bool = True
@@ -314,6 +536,10 @@ def load_models(
     """
     global medgemma, translategemma
 
+    # Steady state: both models resident — one lock-free Event check.
+    if _models_ready.is_set():
+        return True, None
+
     # If both logical roles point to the same exact model artifact,
     # reuse a single Llama instance to avoid double memory residency.
     shared_model_config = (
@@ -363,6 +589,7 @@ def load_models(
                     n_threads=config.model.n_threads,
                     verbose=False
                 )
+                _enable_prompt_cache(shared_model)
                 medgemma = shared_model
                 translategemma = shared_model
                 request_logger.info("Shared model loaded successfully")
@@ -374,49 +601,53 @@ def load_models(
                 elif translategemma is not None and medgemma is None:
                     medgemma = translategemma
 
-            if require_medgemma and medgemma is None:
-                request_logger.info("Downloading MedGemma...")
-                # B-07: Explicitly pass token — deploy.sh may set HUGGINGFACE_TOKEN
-                # but huggingface_hub expects HF_TOKEN. Support both.
-                hf_token = os.environ.get('HF_TOKEN') or os.environ.get('HUGGINGFACE_TOKEN')
-                med_path = hf_hub_download(  # nosec B615 — revision pinned via config
+            need_med = require_medgemma and medgemma is None
+            need_trans = require_translategemma and translategemma is None
+
+            if need_med and need_trans:
+                # Overlap the two downloads and weight loads — HF network
+                # I/O and mmap time for one model hides behind the other's.
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    med_future = pool.submit(
+                        _load_model_artifact,
+                        config.model.medgemma_repo,
+                        config.model.medgemma_file,
+                        config.model.medgemma_revision,
+                        config.model.medgemma_sha256,
+                        "MedGemma",
+                    )
+                    trans_future = pool.submit(
+                        _load_model_artifact,
+                        config.model.translategemma_repo,
+                        config.model.translategemma_file,
+                        config.model.translategemma_revision,
+                        config.model.translategemma_sha256,
+                        "TranslateGemma",
+                    )
+                    medgemma = med_future.result()
+                    translategemma = trans_future.result()
+            elif need_med:
+                medgemma = _load_model_artifact(
                     config.model.medgemma_repo,
                     config.model.medgemma_file,
-                    revision=config.model.medgemma_revision,
-                    token=hf_token
+                    config.model.medgemma_revision,
+                    config.model.medgemma_sha256,
+                    "MedGemma",
                 )
-                if not _verify_model_hash(med_path, config.model.medgemma_sha256):
-                    raise RuntimeError("MedGemma model integrity verification failed (SHA-256 mismatch).")
-
-                medgemma = Llama(
-                    model_path=med_path,
-                    n_ctx=config.model.context_size,
-                    n_gpu_layers=config.model.n_gpu_layers,
-                    n_threads=config.model.n_threads,
-                    verbose=False
-                )
-                request_logger.info("MedGemma loaded successfully")
-
-            if require_translategemma and translategemma is None:
-                request_logger.info("Downloading TranslateGemma...")
-                hf_token = os.environ.get('HF_TOKEN') or os.environ.get('HUGGINGFACE_TOKEN')
-                trans_path = hf_hub_download(  # nosec B615 — revision pinned via config
+            elif need_trans:
+                translategemma = _load_model_artifact(
                     config.model.translategemma_repo,
                     config.model.translategemma_file,
-                    revision=config.model.translategemma_revision,
-                    token=hf_token
+                    config.model.translategemma_revision,
+                    config.model.translategemma_sha256,
+                    "TranslateGemma",
                 )
-                if not _verify_model_hash(trans_path, config.model.translategemma_sha256):
-                    raise RuntimeError("TranslateGemma model integrity verification failed (SHA-256 mismatch).")
 
-                translategemma = Llama(
-                    model_path=trans_path,
-                    n_ctx=config.model.context_size,
-                    n_gpu_layers=config.model.n_gpu_layers,
-                    n_threads=config.model.n_threads,
-                    verbose=False
-                )
-                request_logger.info("TranslateGemma loaded successfully")
+            if medgemma is not None and translategemma is not None:
+                _models_ready.set()
+                # Pre-evaluate the constant template prefixes so the first
+                # real request's prefill only ingests the user text.
+                _warm_prompt_prefixes()
 
             return True, None
 
@@ -426,25 +657,260 @@ def load_models(
             return False, error_msg
 
 
-def require_models(
+# Opt-in warm start: kick off both model loads in the background as soon as
+# the worker imports the app, so the first request doesn't pay the full
+# download + weight-load latency. Off by default — tests and local runs
+# shouldn't pull multi-GB artifacts at import.
+if os.environ.get('NKU_PRELOAD_MODELS', '0') != '0':
+    threading.Thread(target=load_models, daemon=True,
+                     name='nku-model-preload').start()
+
+
+# Fixed-content error payloads, encoded once. The rate-limit body splices
+# the request ID onto a static prefix — IDs are generated hex or validated
+# [A-Za-z0-9-], so the concatenation cannot break the JSON.
+_ERR_UNAUTHORIZED = b'{"error":"unauthorized","message":"Invalid or missing API key"}'
+_ERR_MISCONFIGURED = (b'{"error":"misconfigured","message":'
+                      b'"API key not configured. Set NKU_API_KEY environment variable."}')
+_ERR_MODEL_LOAD = (b'{"error":"model_load_failed","message":'
+                   b'"Failed to load required AI model(s). Please try again later."}')
+_RATE_LIMIT_PREFIX = (b'{"error":"rate_limit_exceeded","message":'
+                      b'"Too many requests. Please slow down.","request_id":"')
+
+
+def _static_error(body: bytes, status: int):
+    """Build a JSON error response from a pre-encoded body."""
+    return app.response_class(body, status=status, mimetype='application/json')
+
+
+def _deadline_stopping_criteria():
+    """Stopping-criteria callback bound to the request's inference deadline.
+
+    llama.cpp consults stopping_criteria between tokens, so generation
+    halts at the next token boundary once the budget set by nku_endpoint
+    is spent — graceful truncation instead of an async exception. Returns
+    None (llama.cpp's default) when no deadline is active.
+    """
+    deadline = g.get('inference_deadline')
+    if deadline is None:
+        return None
+
+    def _expired(input_ids, logits) -> bool:
+        return time.monotonic() >= deadline
+
+    return _expired
+
+
+def _sse_inference(worker: _InferenceWorker, prompt: str, result_key: str,
+                   params: dict, warnings):
+    """Server-sent-events response for one streaming inference.
+
+    Emits a data: {"token": ...} event per decoded chunk, then a final
+    data: {"done": true, <result_key>: ...} event carrying the validated
+    full text — output validation still sees the complete response, it
+    just runs after the tokens have been relayed. Errors surface as a
+    data: {"error": ...} event since the 200 header is already sent.
+    """
+    dumps = app.json.dumps
+
+    def events():
+        pieces = []
+        try:
+            for token in worker.iter_stream(prompt, **params):
+                pieces.append(token)
+                yield f"data: {dumps({'token': token})}\n\n"
+        except Exception as e:
+            request_logger.error(f"Streaming inference failed: {str(e)}")
+            yield f"data: {dumps({'error': 'inference_error'})}\n\n"
+            return
+
+        is_valid, cleaned = PromptProtector.validate_output(''.join(pieces).strip())
+        if not is_valid:
+            request_logger.warning("Streaming output validation failed")
+            yield f"data: {dumps({'error': 'generation_error'})}\n\n"
+            return
+
+        final = {'done': True, result_key: cleaned}
+        if warnings:
+            final['warnings'] = warnings
+        yield f"data: {dumps(final)}\n\n"
+
+    return Response(stream_with_context(events()), mimetype='text/event-stream')
+
+
+
+def _translation_prompt_parts(text: str, source_lang: str, target_lang: str,
+                              glossary: str) -> tuple:
+    """(prefix, text, suffix) form of build_translation_prompt.
+
+    Structured prompts let the worker tokenize the constant scaffold once
+    per model and cache the token lists, so per request only the user
+    text hits the tokenizer.
+    """
+    prefix, suffix = _translation_scaffold(source_lang, target_lang, glossary)
+    return (prefix, text, suffix)
+
+
+def _triage_prompt_parts(symptoms: str) -> tuple:
+    """(prefix, symptoms, suffix) form of build_triage_prompt."""
+    return (PromptProtector._TRI_PREFIX, symptoms, PromptProtector._TRI_SUFFIX)
+
+
+# =============================================================================
+# ADMISSION CONTROL
+# =============================================================================
+
+# Inference serializes through the per-model workers, so admitting every
+# HTTP request just grows the worker queues until deadlines expire. Bound
+# the number of requests past validation instead: callers over the bound
+# wait up to the admission timeout for a slot, then get a 504 rather than
+# holding a gunicorn thread for a result that would time out anyway.
+_MAX_INFLIGHT = int(os.environ.get('NKU_MAX_INFLIGHT', '4'))
+_ADMISSION_TIMEOUT_SECONDS = 30.0
+_admission = threading.BoundedSemaphore(_MAX_INFLIGHT)
+_admission_lock = threading.Lock()
+_active_requests = 0
+_queued_requests = 0
+
+_ERR_OVERLOADED = (b'{"error":"server_overloaded","message":'
+                   b'"Timed out waiting for an inference slot. Please retry later."}')
+
+
+def nku_endpoint(
+    required_fields: Optional[list] = None,
     require_medgemma: bool = True,
-    require_translategemma: bool = True
+    require_translategemma: bool = True,
+    timeout_seconds: int = 120,
+    max_size_bytes: int = 5 * 1024 * 1024,
 ):
-    """Decorator to ensure required models are loaded before endpoint execution."""
+    """Fused middleware for inference endpoints.
+
+    Collapses the former six-decorator stack (log_request, rate_limit,
+    require_api_key, validate_json_request, require_models, with_timeout)
+    into one wrapper, so a request traverses two call frames instead of
+    seven. Checks run in the same order and return the same responses as
+    the individual decorators they replace.
+    """
     def decorator(f):
         @wraps(f)
-        def decorated_function(*args, **kwargs):
-            success, error = load_models(
-                require_medgemma=require_medgemma,
-                require_translategemma=require_translategemma
-            )
-            if not success:
+        def fused(*args, **kwargs):
+            # Rate limiting (was @rate_limit)
+            if rate_limiter is not None:
+                is_allowed, error_info = rate_limiter.check_rate_limit(request)
+                if not is_allowed:
+                    # S-08: Structured audit logging for blocked requests
+                    client_id = rate_limiter._get_client_id(request)
+                    request_logger.warning(
+                        f"Rate limit blocked: client={client_id} "
+                        f"endpoint={request.path} method={request.method}"
+                    )
+                    response = jsonify(error_info)
+                    response.status_code = 429
+                    response.headers['Retry-After'] = str(error_info.get('retry_after', 60))
+                    return response
+
+            # API key (was @require_api_key; reads the global at call time)
+            if _api_key:
+                if request.headers.get('X-API-Key', '') != _api_key:
+                    return _static_error(_ERR_UNAUTHORIZED, 401)
+            elif not config.debug:
+                return _static_error(_ERR_MISCONFIGURED, 503)
+
+            # JSON body validation (was @validate_json_request). The declared
+            # Content-Length rejects oversized uploads before any buffering;
+            # the body is then read once uncached (no second copy pinned for
+            # the request lifetime) and handed straight to the JSON parser
+            # instead of being re-read by request.get_json().
+            if (request.content_length or 0) > max_size_bytes:
+                return jsonify({
+                    'error': 'payload_too_large',
+                    'message': f'Request body exceeds maximum size of {max_size_bytes} bytes'
+                }), 413
+            try:
+                raw_data = request.get_data(cache=False, as_text=False)
+                # Content-Length can be spoofed or absent; verify raw bytes.
+                if len(raw_data) > max_size_bytes:
+                    return jsonify({
+                        'error': 'payload_too_large',
+                        'message': f'Request body exceeds maximum size of {max_size_bytes} bytes'
+                    }), 413
+            except Exception:
+                return jsonify({
+                    'error': 'payload_too_large',
+                    'message': 'Failed to read payload size'
+                }), 413
+
+            if not request.is_json:
+                return jsonify({
+                    'error': 'invalid_content_type',
+                    'message': 'Content-Type must be application/json'
+                }), 400
+
+            try:
+                data = app.json.loads(raw_data)
+            except Exception:
                 return jsonify({
-                    'error': 'model_load_failed',
-                    'message': 'Failed to load required AI model(s). Please try again later.'
-                }), 503
-            return f(*args, **kwargs)
-        return decorated_function
+                    'error': 'invalid_json',
+                    'message': 'Request body must be valid JSON'
+                }), 400
+
+            if data is None:
+                return jsonify({
+                    'error': 'empty_body',
+                    'message': 'Request body cannot be empty'
+                }), 400
+
+            if required_fields:
+                missing = [name for name in required_fields if name not in data]
+                if missing:
+                    return jsonify({
+                        'error': 'missing_fields',
+                        'message': f'Missing required fields: {", ".join(missing)}'
+                    }), 400
+
+            # Hand the parsed body to the endpoint via g so it does not go
+            # back through request.get_json()'s mimetype/cache machinery.
+            g.json = data
+
+            # Admission control: cheap rejects are done, so this request
+            # represents real inference work. Streaming responses release
+            # their slot on return — their decode is still serialized by
+            # the per-model workers.
+            global _active_requests, _queued_requests
+            with _admission_lock:
+                _queued_requests += 1
+            try:
+                admitted = _admission.acquire(timeout=_ADMISSION_TIMEOUT_SECONDS)
+            finally:
+                with _admission_lock:
+                    _queued_requests -= 1
+            if not admitted:
+                return _static_error(_ERR_OVERLOADED, 504)
+            with _admission_lock:
+                _active_requests += 1
+
+            try:
+                # Model availability (was @require_models)
+                success, error = load_models(
+                    require_medgemma=require_medgemma,
+                    require_translategemma=require_translategemma
+                )
+                if not success:
+                    return _static_error(_ERR_MODEL_LOAD, 503)
+
+                # Inference time budget (replaces @with_timeout): endpoints
+                # pass a deadline-checking stopping_criteria into each llama
+                # call, so an over-budget generation stops cleanly at a token
+                # boundary instead of being torn down by SIGALRM mid C-call.
+                g.inference_deadline = time.monotonic() + timeout_seconds
+
+                return f(*args, **kwargs)
+            finally:
+                _admission.release()
+                with _admission_lock:
+                    _active_requests -= 1
+
+        return log_request(logger)(fused)
     return decorator
 
 
@@ -452,28 +918,59 @@ def require_models(
 # HEALTH CHECK
 # =============================================================================
 
+# Probe responses are constant, and orchestrators hit them every few
+# seconds — pre-serialize the bodies once instead of running jsonify per
+# probe. Security headers still apply via after_request (the regression
+# tests pin them on /health).
+_HEALTH_BODY = b'{"status":"ok","service":"nku-inference"}'
+_READY_BODY = (b'{"status":"ready","service":"nku-inference",'
+               b'"models":{"medgemma":true,"translategemma":true}}')
+
+
 @app.route('/health', methods=['GET'])
 def health():
     """Liveness probe — is the process alive? (S-01: version hidden)"""
-    return jsonify({
-        "status": "ok",
-        "service": "nku-inference"
-    })
+    return app.response_class(_HEALTH_BODY, mimetype='application/json')
 
 
 @app.route('/ready', methods=['GET'])
 def ready():
     """Readiness probe — can this instance serve inference requests?"""
-    models_ready = medgemma is not None and translategemma is not None
-    status_code = 200 if models_ready else 503
+    if medgemma is not None and translategemma is not None:
+        return app.response_class(_READY_BODY, mimetype='application/json')
+    # Cold path: report which model is missing
     return jsonify({
-        "status": "ready" if models_ready else "not_ready",
+        "status": "not_ready",
         "service": "nku-inference",
         "models": {
             "medgemma": medgemma is not None,
             "translategemma": translategemma is not None
         }
-    }), status_code
+    }), 503
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Operational counters for load balancers and dashboards.
+
+    Unauthenticated by design, like /health and /ready: autoscalers and
+    uptime probes cannot attach the API key. The S-01 posture still
+    holds — the payload is coarse queue counters, the fixed worker role
+    names, and a readiness flag; no versions, artifact names, or
+    request data.
+    """
+    with _admission_lock:
+        active, queued = _active_requests, _queued_requests
+    return jsonify({
+        'active_requests': active,
+        'queued_requests': queued,
+        'max_concurrency': _MAX_INFLIGHT,
+        'worker_backlog': {
+            'translation': _translation_worker.pending(),
+            'triage': _triage_worker.pending(),
+        },
+        'models_loaded': _models_ready.is_set(),
+    })
 
 
 # =============================================================================
@@ -481,12 +978,9 @@ def ready():
 # =============================================================================
 
 @app.route('/translate', methods=['POST'])
-@log_request(logger)
-@rate_limit(rate_limiter)
-@require_api_key
-@validate_json_request(required_fields=['text'])
-@require_models(require_medgemma=False, require_translategemma=True)
-@with_timeout(120)
+@nku_endpoint(required_fields=['text'],
+              require_medgemma=False, require_translategemma=True,
+              timeout_seconds=120)
 def translate():
     """
     Translate between Twi and English.
@@ -496,7 +990,7 @@ def translate():
         - source (optional): Source language code (default: 'twi')
         - target (optional): Target language code (default: 'en')
     """
-    data = request.get_json()
+    data = g.json
 
     # Validate text input
     text_result = input_validator.validate_text(
@@ -513,22 +1007,24 @@ def translate():
     source_lang = data.get('source', 'twi')
     target_lang = data.get('target', 'en')
 
-    source_result = input_validator.validate_language(source_lang)
-    if not source_result.is_valid:
-        return jsonify({
-            'error': 'validation_error',
-            'message': source_result.errors[0]
-        }), 400
-    else:
+    # Fast path: codes already in canonical lowercase form need no
+    # normalization; only non-members go through the full validator.
+    if source_lang not in _VALID_LANGS:
+        source_result = input_validator.validate_language(source_lang)
+        if not source_result.is_valid:
+            return jsonify({
+                'error': 'validation_error',
+                'message': source_result.errors[0]
+            }), 400
         source_lang = source_result.sanitized_value
 
-    target_result = input_validator.validate_language(target_lang)
-    if not target_result.is_valid:
-        return jsonify({
-            'error': 'validation_error',
-            'message': target_result.errors[0]
-        }), 400
-    else:
+    if target_lang not in _VALID_LANGS:
+        target_result = input_validator.validate_language(target_lang)
+        if not target_result.is_valid:
+            return jsonify({
+                'error': 'validation_error',
+                'message': target_result.errors[0]
+            }), 400
         target_lang = target_result.sanitized_value
 
     # Normalize Twi/Akan language codes: ak=akan=tw → twi
@@ -540,21 +1036,29 @@ def translate():
 
     # Build safe prompt (B-05: include MEDICAL_GLOSSARY for Twi translations)
     glossary_hint = MEDICAL_GLOSSARY if source_lang == 'twi' or target_lang == 'twi' else ''
-    prompt = PromptProtector.build_translation_prompt(
-        text_result.sanitized_value,
-        source_lang=source_lang,
-        target_lang=target_lang,
-        glossary=glossary_hint
+    prompt = _translation_prompt_parts(
+        text_result.sanitized_value, source_lang, target_lang, glossary_hint
     )
 
-    try:
-        result = translategemma(
-            prompt,
-            max_tokens=config.inference.max_translation_tokens,
-            temperature=config.inference.translation_temperature,
-            stop=["\n\n", "<<<USER_INPUT>>>"]
+    params = dict(
+        max_tokens=config.inference.max_translation_tokens,
+        temperature=config.inference.translation_temperature,
+        stop=["\n\n", "<<<USER_INPUT>>>"],
+        stopping_criteria=_deadline_stopping_criteria()
+    )
+
+    # Opt-in token streaming: with {"stream": true} the client sees
+    # time-to-first-token instead of full-decode latency. The buffered
+    # JSON contract below is unchanged for everyone else.
+    if data.get('stream'):
+        return _sse_inference(
+            _translation_worker, prompt, 'translation', params,
+            text_result.warnings
         )
 
+    try:
+        result = _translation_worker(prompt, **params)
+
         raw_translation = result['choices'][0]['text'].strip()
         is_valid, translation = PromptProtector.validate_output(raw_translation)
 
@@ -585,12 +1089,9 @@ def translate():
 # =============================================================================
 
 @app.route('/triage', methods=['POST'])
-@log_request(logger)
-@rate_limit(rate_limiter)
-@require_api_key
-@validate_json_request(required_fields=['symptoms'])
-@require_models(require_medgemma=True, require_translategemma=False)
-@with_timeout(120)
+@nku_endpoint(required_fields=['symptoms'],
+              require_medgemma=True, require_translategemma=False,
+              timeout_seconds=120)
 def triage():
     """
     Medical triage analysis.
@@ -598,7 +1099,7 @@ def triage():
     Request body:
         - symptoms (required): Patient symptoms description
     """
-    data = request.get_json()
+    data = g.json
 
     # Validate symptom input
     symptoms_result = input_validator.validate_symptoms(data.get('symptoms'))
@@ -609,16 +1110,25 @@ def triage():
         }), 400
 
     # Build safe prompt
-    prompt = PromptProtector.build_triage_prompt(symptoms_result.sanitized_value)
+    prompt = _triage_prompt_parts(symptoms_result.sanitized_value)
 
-    try:
-        result = medgemma(
-            prompt,
-            max_tokens=config.inference.max_triage_tokens,
-            temperature=config.inference.triage_temperature,
-            stop=["<<<USER_INPUT>>>", "Patient symptoms:"]
+    params = dict(
+        max_tokens=config.inference.max_triage_tokens,
+        temperature=config.inference.triage_temperature,
+        stop=["<<<USER_INPUT>>>", "Patient symptoms:"],
+        stopping_criteria=_deadline_stopping_criteria()
+    )
+
+    # Opt-in token streaming, mirroring /translate.
+    if data.get('stream'):
+        return _sse_inference(
+            _triage_worker, prompt, 'assessment', params,
+            symptoms_result.warnings
         )
 
+    try:
+        result = _triage_worker(prompt, **params)
+
         raw_assessment = result['choices'][0]['text'].strip()
         is_valid, assessment = PromptProtector.validate_output(raw_assessment)
 
@@ -646,21 +1156,134 @@ def triage():
 # NKU CYCLE ENDPOINT
 # =============================================================================
 
+# Constant prefixes of the prompt templates (everything before the user
+# text), used to prime each model's prompt cache so a real request's
+# prefill only ingests the user text, not the ~300-token scaffold. The
+# translation prefix covers the standard twi→en + glossary combination
+# that /translate defaults to and the cycle always uses.
+_TRIAGE_PREFIX = PromptProtector._TRI_PREFIX
+_TRANSLATE_PREFIX = _translation_scaffold('twi', 'en', MEDICAL_GLOSSARY)[0]
+
+
+def _warm_prefix(worker: _InferenceWorker, prefix: str) -> None:
+    """Queue a 1-token evaluation of a constant prefix on one worker.
+
+    The LlamaRAMCache attached at load time snapshots the KV state after
+    the evaluation, so the next prompt opening with the same prefix
+    restores it instead of re-prefilling. Fire-and-forget; only applies
+    to real Llama instances with a cache attached (mocks and test
+    doubles skip it).
+    """
+    model = globals()[worker.role]
+    if Llama is None or not isinstance(model, Llama):
+        return
+    if getattr(model, 'cache', None) is None:
+        return
+    worker.submit(prefix, max_tokens=1, temperature=0.0)
+
+
+def _warm_triage_prefix() -> None:
+    """Prime medgemma's prompt cache with the constant triage prefix.
+
+    Also queued mid-cycle, while translategemma decodes stage 1, so the
+    prefix KV state is fresh when the real triage prompt arrives.
+    """
+    _warm_prefix(_triage_worker, _TRIAGE_PREFIX)
+
+
+def _warm_prompt_prefixes() -> None:
+    """Pre-evaluate both constant template prefixes after model load."""
+    _warm_prefix(_translation_worker, _TRANSLATE_PREFIX)
+    _warm_triage_prefix()
+
+
+class _CycleStageError(Exception):
+    """A cycle stage produced output that failed validation."""
+
+    def __init__(self, log_message: str, client_message: str):
+        super().__init__(log_message)
+        self.client_message = client_message
+
+
+def _cycle_stages(twi_input: str):
+    """Run the three Nku cycle stages, yielding (field, value) as each
+    completes. Shared by the buffered and streaming /nku-cycle paths.
+    Raises _CycleStageError when a stage's output fails validation.
+    """
+    # Overlap: warm medgemma's triage prefix on its own worker while the
+    # translation worker runs stage 1 — the stages' data dependency only
+    # covers the user text, not the constant template.
+    _warm_triage_prefix()
+
+    # Step 1: Translate Twi to English
+    trans_prompt = _translation_prompt_parts(
+        twi_input, 'twi', 'en', MEDICAL_GLOSSARY
+    )
+    trans_result = _translation_worker(
+        trans_prompt,
+        max_tokens=config.inference.max_translation_tokens,
+        temperature=config.inference.translation_temperature,
+        stop=["\n\n", "<<<USER_INPUT>>>"],
+        stopping_criteria=_deadline_stopping_criteria()
+    )
+    # Finding 5 fix: gate on is_valid (was discarded with _)
+    raw_translation = trans_result['choices'][0]['text'].strip()
+    is_valid, english = PromptProtector.validate_output(raw_translation)
+    if not is_valid:
+        raise _CycleStageError("Translation output validation failed",
+                               'Failed to generate valid translation')
+    yield 'english_translation', english
+
+    # Step 2: Medical triage
+    triage_prompt = _triage_prompt_parts(english)
+    triage_result = _triage_worker(
+        triage_prompt,
+        max_tokens=config.inference.max_triage_tokens,
+        temperature=config.inference.triage_temperature,
+        stop=["<<<USER_INPUT>>>"],
+        stopping_criteria=_deadline_stopping_criteria()
+    )
+    raw_assessment = triage_result['choices'][0]['text'].strip()
+    is_valid, assessment = PromptProtector.validate_output(raw_assessment)
+    if not is_valid:
+        raise _CycleStageError("Triage output validation failed",
+                               'Failed to generate valid triage assessment')
+    yield 'triage_assessment', assessment
+
+    # Step 3: Translate response back to Twi
+    back_prompt = _translation_prompt_parts(
+        assessment, 'en', 'twi', MEDICAL_GLOSSARY
+    )
+    back_result = _translation_worker(
+        back_prompt,
+        max_tokens=config.inference.max_translation_tokens,
+        temperature=config.inference.translation_temperature,
+        stop=["\n\n", "<<<USER_INPUT>>>"],
+        stopping_criteria=_deadline_stopping_criteria()
+    )
+    raw_back = back_result['choices'][0]['text'].strip()
+    is_valid, twi_output = PromptProtector.validate_output(raw_back)
+    if not is_valid:
+        raise _CycleStageError("Back-translation output validation failed",
+                               'Failed to generate valid back-translation')
+    yield 'twi_output', twi_output
+
+
 @app.route('/nku-cycle', methods=['POST'])
-@log_request(logger)
-@rate_limit(rate_limiter)
-@require_api_key
-@validate_json_request(required_fields=['text'])
-@require_models(require_medgemma=True, require_translategemma=True)
-@with_timeout(300)
+@nku_endpoint(required_fields=['text'],
+              require_medgemma=True, require_translategemma=True,
+              timeout_seconds=300)
 def nku_cycle():
     """
     Full Nku Cycle: Twi → English → Triage → Twi.
 
     Request body:
         - text (required): Patient symptoms in Twi
+        - stream (optional): If true, respond with NDJSON — one line per
+          completed stage — so clients see the translation while triage
+          and back-translation are still generating.
     """
-    data = request.get_json()
+    data = g.json
 
     # Validate input
     text_result = input_validator.validate_text(
@@ -674,74 +1297,47 @@ def nku_cycle():
         }), 400
 
     twi_input = text_result.sanitized_value
+    warnings = text_result.warnings if text_result.warnings else None
 
-    try:
-        # Step 1: Translate Twi to English
-        trans_prompt = PromptProtector.build_translation_prompt(
-            twi_input, source_lang='twi', target_lang='en',
-            glossary=MEDICAL_GLOSSARY
-        )
-        trans_result = translategemma(
-            trans_prompt,
-            max_tokens=config.inference.max_translation_tokens,
-            temperature=config.inference.translation_temperature,
-            stop=["\n\n", "<<<USER_INPUT>>>"]
-        )
-        # Finding 5 fix: gate on is_valid (was discarded with _)
-        raw_translation = trans_result['choices'][0]['text'].strip()
-        is_valid, english = PromptProtector.validate_output(raw_translation)
-        if not is_valid:
-            request_logger.warning("Translation output validation failed")
-            return jsonify({
-                'error': 'generation_error',
-                'message': 'Failed to generate valid translation'
-            }), 500
-
-        # Step 2: Medical triage
-        triage_prompt = PromptProtector.build_triage_prompt(english)
-        triage_result = medgemma(
-            triage_prompt,
-            max_tokens=config.inference.max_triage_tokens,
-            temperature=config.inference.triage_temperature,
-            stop=["<<<USER_INPUT>>>"]
-        )
-        # Finding 5 fix: gate on is_valid (was discarded with _)
-        raw_assessment = triage_result['choices'][0]['text'].strip()
-        is_valid, assessment = PromptProtector.validate_output(raw_assessment)
-        if not is_valid:
-            request_logger.warning("Triage output validation failed")
-            return jsonify({
-                'error': 'generation_error',
-                'message': 'Failed to generate valid triage assessment'
-            }), 500
-
-        # Step 3: Translate response back to Twi
-        back_prompt = PromptProtector.build_translation_prompt(
-            assessment, source_lang='en', target_lang='twi',
-            glossary=MEDICAL_GLOSSARY
-        )
-        back_result = translategemma(
-            back_prompt,
-            max_tokens=config.inference.max_translation_tokens,
-            temperature=config.inference.translation_temperature,
-            stop=["\n\n", "<<<USER_INPUT>>>"]
-        )
-        # Finding 5 fix: gate on is_valid (was discarded with _)
-        raw_back = back_result['choices'][0]['text'].strip()
-        is_valid, twi_output = PromptProtector.validate_output(raw_back)
-        if not is_valid:
-            request_logger.warning("Back-translation output validation failed")
-            return jsonify({
-                'error': 'generation_error',
-                'message': 'Failed to generate valid back-translation'
-            }), 500
+    if data.get('stream'):
+        # NDJSON streaming: each stage is flushed as soon as it completes.
+        # Errors after the first line cannot change the HTTP status, so
+        # they are reported as a final {"error": ...} line.
+        def generate():
+            try:
+                for field, value in _cycle_stages(twi_input):
+                    yield app.json.dumps({field: value}) + '\n'
+                if warnings:
+                    yield app.json.dumps({'warnings': warnings}) + '\n'
+            except _CycleStageError as e:
+                request_logger.warning(str(e))
+                yield app.json.dumps({
+                    'error': 'generation_error',
+                    'message': e.client_message
+                }) + '\n'
+            except Exception as e:
+                request_logger.error(f"Nku cycle failed: {str(e)}")
+                yield app.json.dumps({
+                    'error': 'inference_error',
+                    'message': 'Processing failed. Please try again.'
+                }) + '\n'
+
+        return Response(stream_with_context(generate()),
+                        mimetype='application/x-ndjson')
 
+    try:
+        results = {}
+        for field, value in _cycle_stages(twi_input):
+            results[field] = value
+        results['warnings'] = warnings
+        return jsonify(results)
+
+    except _CycleStageError as e:
+        request_logger.warning(str(e))
         return jsonify({
-            "english_translation": english,
-            "triage_assessment": assessment,
-            "twi_output": twi_output,
-            "warnings": text_result.warnings if text_result.warnings else None
-        })
+            'error': 'generation_error',
+            'message': e.client_message
+        }), 500
 
     except Exception as e:
         request_logger.error(f"Nku cycle failed: {str(e)}")
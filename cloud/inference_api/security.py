@@ -5,14 +5,32 @@ Provides input validation, prompt injection protection, rate limiting, and CORS
 
 import re
 import time
-import base64
+import binascii
+import hashlib
+import heapq
+import ipaddress
+import json
 import os
-from functools import wraps
+import threading
+from functools import lru_cache, wraps
 from typing import Optional, Tuple, Dict, Any, List
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import defaultdict, deque
 import logging
 
+# Module-level so the decorators below don't re-run the import machinery
+# (a sys.modules lookup per name) on every request.
+from flask import g, jsonify, request
+
+try:
+    # Optional: RE2 compiles to a DFA with guaranteed linear-time matching,
+    # closing the ReDoS window a backtracking engine leaves on the
+    # injection-pattern scan. Not in requirements.txt (needs a native
+    # abseil/re2 build); stdlib re is the fallback.
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -108,23 +126,47 @@ class InputValidator:
         '$': 's',
     })
 
-    OVERRIDE_VERBS = {
+    OVERRIDE_VERBS = frozenset({
         'ignore', 'forget', 'disregard', 'override', 'bypass', 'disable',
         'stop', 'prioritize', 'prioritise', 'replace', 'reveal', 'disclose',
         'share', 'print', 'dump', 'show', 'output', 'expose'
-    }
+    })
 
-    CONTROL_TARGETS = {
+    CONTROL_TARGETS = frozenset({
         'instruction', 'instructions', 'prompt', 'system', 'developer',
         'policy', 'policies', 'rule', 'rules', 'safety', 'guardrail',
         'guardrails', 'directive', 'directives', 'guidance', 'hidden', 'internal'
-    }
+    })
+
+    _INIT_MARKERS = frozenset({'initialized', 'initialised'})
+    _INIT_TARGETS = frozenset({'instructions', 'prompt', 'rules', 'directives'})
+
+    # Compiled once so _check_instruction_override_intent skips the module
+    # regex-cache lookup on every call.
+    _TOKEN_RE = re.compile(r'[a-z]+')
+
+    # Built once for _check_base64_injection's per-token alphabet test.
+    _B64_ALPHABET = frozenset(
+        'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/='
+    )
 
     def __init__(self):
-        self._compiled_patterns = [
-            re.compile(pattern, re.IGNORECASE)
-            for pattern in self.INJECTION_PATTERNS
-        ]
+        # All patterns combined into one alternation: a single scan per
+        # input (plus one over the leet-normalized form) instead of
+        # 2 × len(INJECTION_PATTERNS) independent searches, each with its
+        # own Python→C transition. None of the patterns use backreferences,
+        # so wrapping them in non-capturing groups is semantics-preserving.
+        combined = '|'.join(f'(?:{p})' for p in self.INJECTION_PATTERNS)
+        self._injection_re = None
+        if _re2 is not None:
+            # Backreference-free, so RE2 is a drop-in; fall back to the
+            # stdlib engine if a future pattern uses syntax RE2 rejects.
+            try:
+                self._injection_re = _re2.compile(combined, _re2.IGNORECASE)
+            except Exception:
+                logger.warning("RE2 rejected the injection pattern bank — using stdlib re")
+        if self._injection_re is None:
+            self._injection_re = re.compile(combined, re.IGNORECASE)
 
     def validate_text(self, text: Optional[str], max_length: int = None) -> ValidationResult:
         """Validate and sanitize text input."""
@@ -150,22 +192,26 @@ class InputValidator:
 
         # Normalize/remove dangerous Unicode BEFORE injection checks.
         # This prevents homoglyph payloads from bypassing regex patterns.
-        sanitized = self._sanitize_unicode(sanitized)
+        # Pure-ASCII text (the common case for symptom strings) cannot
+        # contain homoglyphs or zero-width characters, so the translate
+        # pass is skipped; isascii() is a C-level flag check.
+        if not sanitized.isascii():
+            sanitized = self._sanitize_unicode(sanitized)
 
         # Check for injection patterns
         injection_detected = self._check_injection_patterns(sanitized)
         if injection_detected:
             errors.append("Input contains potentially malicious patterns")
-            # F-09: Log hash only — never log patient symptom text (PHI risk)
-            import hashlib
-            input_hash = hashlib.sha256(sanitized.encode()).hexdigest()[:16]
+            # F-09: Log hash only — never log patient symptom text (PHI risk).
+            # BLAKE2s is faster than SHA-256 on these short inputs and 8
+            # bytes (16 hex chars) is plenty for a log correlation ID.
+            input_hash = hashlib.blake2s(sanitized.encode(), digest_size=8).hexdigest()
             logger.warning(f"Injection attempt detected [input_hash={input_hash}, len={len(sanitized)}]")
             return ValidationResult(False, "", errors)
 
         if self._check_instruction_override_intent(sanitized):
             errors.append("Input contains potentially malicious patterns")
-            import hashlib
-            input_hash = hashlib.sha256(sanitized.encode()).hexdigest()[:16]
+            input_hash = hashlib.blake2s(sanitized.encode(), digest_size=8).hexdigest()
             logger.warning(f"Override-intent prompt injection detected [input_hash={input_hash}, len={len(sanitized)}]")
             return ValidationResult(False, "", errors)
 
@@ -197,46 +243,39 @@ class InputValidator:
         return result
 
     def validate_language(self, lang: Optional[str]) -> ValidationResult:
-        """Validate language code."""
+        """Validate language code.
+
+        The input domain is the ~20-code allow-list plus a handful of
+        typos, and the check is pure, so results are memoized (see
+        _validate_language_cached) — repeat lookups skip normalization
+        and ValidationResult construction entirely.
+        """
         if lang is None:
             return ValidationResult(False, "", ["Language code is required"])
-
-        sanitized = lang.strip().lower()
-
-        if len(sanitized) > self.MAX_LANGUAGE_CODE_LENGTH:
-            return ValidationResult(False, "", ["Invalid language code length"])
-
-        if sanitized not in self.ALLOWED_LANGUAGES:
-            return ValidationResult(
-                False, "",
-                [f"Unsupported language code: {sanitized}. Allowed: {', '.join(sorted(self.ALLOWED_LANGUAGES))}"]
-            )
-
-        return ValidationResult(True, sanitized)
+        return _validate_language_cached(lang)
 
     def _check_injection_patterns(self, text: str) -> bool:
         """Check for prompt injection patterns."""
+        if self._injection_re.search(text):
+            return True
         leet_normalized = self._normalize_leetspeak(text)
-        for pattern in self._compiled_patterns:
-            if pattern.search(text) or pattern.search(leet_normalized):
-                return True
-        return False
+        return leet_normalized != text and bool(self._injection_re.search(leet_normalized))
 
     def _check_instruction_override_intent(self, text: str) -> bool:
         """Detect paraphrased override attempts missed by explicit regex patterns."""
         normalized = self._normalize_leetspeak(text.lower())
-        tokens = re.findall(r'[a-z]+', normalized)
+        tokens = self._TOKEN_RE.findall(normalized)
         if not tokens:
             return False
 
+        # Set intersection runs as one hashed sweep in C, vs. a Python
+        # generator frame per token with any().
         token_set = set(tokens)
-        has_override_verb = any(t in self.OVERRIDE_VERBS for t in token_set)
-        has_control_target = any(t in self.CONTROL_TARGETS for t in token_set)
-        if has_override_verb and has_control_target:
+        if (token_set & self.OVERRIDE_VERBS) and (token_set & self.CONTROL_TARGETS):
             return True
 
         # Prompt-leak intent often asks about hidden initialization directives.
-        if {'initialized', 'initialised'} & token_set and {'instructions', 'prompt', 'rules', 'directives'} & token_set:
+        if (token_set & self._INIT_MARKERS) and (token_set & self._INIT_TARGETS):
             return True
 
         return False
@@ -245,44 +284,39 @@ class InputValidator:
         """Normalize common leetspeak substitutions for detection only."""
         return text.translate(self.LEETSPEAK_MAP)
 
+    # Zero-width characters that could be used for injection (deleted) plus
+    # Cyrillic/Greek homoglyphs mapped to their Latin equivalents (L-3 fix),
+    # fused into one translate table so sanitization is a single C pass
+    # instead of ~40 sequential str.replace scans and allocations.
+    _UNICODE_SANITIZE_TABLE = str.maketrans({
+        # Zero-width / invisible characters \u2014 removed
+        '\u200b': None,  # Zero-width space
+        '\u200c': None,  # Zero-width non-joiner
+        '\u200d': None,  # Zero-width joiner
+        '\u2060': None,  # Word joiner
+        '\ufeff': None,  # BOM
+        '\u00ad': None,  # Soft hyphen
+        # Cyrillic uppercase
+        '\u0410': 'A', '\u0412': 'B', '\u0421': 'C', '\u0415': 'E',
+        '\u041d': 'H', '\u041a': 'K', '\u041c': 'M', '\u041e': 'O',
+        '\u0420': 'P', '\u0422': 'T', '\u0425': 'X',
+        '\u0405': 'S',
+        # Cyrillic lowercase
+        '\u0430': 'a', '\u0441': 'c', '\u0435': 'e', '\u043e': 'o',
+        '\u0440': 'p', '\u0445': 'x', '\u0443': 'y', '\u0455': 's', '\u0456': 'i',
+        '\u0458': 'j',
+        # Greek uppercase
+        '\u0391': 'A', '\u0392': 'B', '\u0395': 'E', '\u0396': 'Z',
+        '\u0397': 'H', '\u0399': 'I', '\u039a': 'K', '\u039c': 'M',
+        '\u039d': 'N', '\u039f': 'O', '\u03a1': 'P', '\u03a4': 'T',
+        '\u03a5': 'Y', '\u03a7': 'X',
+        # Greek lowercase
+        '\u03bf': 'o',
+    })
+
     def _sanitize_unicode(self, text: str) -> str:
-        """Remove potentially dangerous unicode characters."""
-        # Remove zero-width characters that could be used for injection
-        dangerous_chars = [
-            '\u200b',  # Zero-width space
-            '\u200c',  # Zero-width non-joiner
-            '\u200d',  # Zero-width joiner
-            '\u2060',  # Word joiner
-            '\ufeff',  # BOM
-            '\u00ad',  # Soft hyphen
-        ]
-        for char in dangerous_chars:
-            text = text.replace(char, '')
-
-        # L-3 fix: Normalize Unicode homoglyphs for common Latin chars
-        # Map Cyrillic/Greek lookalikes to Latin equivalents before pattern check
-        homoglyph_map = {
-            # Cyrillic uppercase
-            '\u0410': 'A', '\u0412': 'B', '\u0421': 'C', '\u0415': 'E',
-            '\u041d': 'H', '\u041a': 'K', '\u041c': 'M', '\u041e': 'O',
-            '\u0420': 'P', '\u0422': 'T', '\u0425': 'X',
-            '\u0405': 'S',
-            # Cyrillic lowercase
-            '\u0430': 'a', '\u0441': 'c', '\u0435': 'e', '\u043e': 'o',
-            '\u0440': 'p', '\u0445': 'x', '\u0443': 'y', '\u0455': 's', '\u0456': 'i',
-            '\u0458': 'j',
-            # Greek uppercase
-            '\u0391': 'A', '\u0392': 'B', '\u0395': 'E', '\u0396': 'Z',
-            '\u0397': 'H', '\u0399': 'I', '\u039a': 'K', '\u039c': 'M',
-            '\u039d': 'N', '\u039f': 'O', '\u03a1': 'P', '\u03a4': 'T',
-            '\u03a5': 'Y', '\u03a7': 'X',
-            # Greek lowercase
-            '\u03bf': 'o',
-        }
-        for homoglyph, replacement in homoglyph_map.items():
-            text = text.replace(homoglyph, replacement)
-
-        return text
+        """Remove dangerous unicode characters and normalize homoglyphs."""
+        return text.translate(self._UNICODE_SANITIZE_TABLE)
 
     def _check_base64_injection(self, text: str) -> bool:
         """L-3 fix: Detect base64-encoded injection payloads.
@@ -292,6 +326,15 @@ class InputValidator:
         word-boundary anchored pattern with length cap, (3) pre-filtering
         tokens by whitespace split to avoid exponential backtracking.
         """
+        # Cheap prefilter: a base64 payload needs ≥20 chars, and encoding
+        # ≥20 chars of anything yields mixed case (or '=' padding) with
+        # overwhelming probability. Pure natural-language input — the common
+        # case — exits here without the token scan or any decode attempt.
+        if len(text) < 20:
+            return False
+        if '=' not in text and sum(c.isupper() for c in text) < 4:
+            return False
+
         # Cap input length to prevent DoS (text is already truncated to 2000
         # by validate_text, but defense-in-depth)
         scan_text = text[:2000]
@@ -299,24 +342,60 @@ class InputValidator:
         # Split on whitespace and scan individual tokens — avoids catastrophic
         # backtracking that occurs when the regex engine tries to match across
         # long runs of base64-alphabet characters.
-        b64_chars = set('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=')
+        b64_chars = self._B64_ALPHABET
         candidates = []
         for token in scan_text.split():
             # Quick pre-filter: token must be ≥20 chars and mostly base64 alphabet
             if len(token) >= 20 and sum(1 for c in token if c in b64_chars) / len(token) > 0.8:
                 candidates.append(token)
 
+        # One real payload is enough for an attacker; decoding every
+        # candidate is wasted work. Try only the three longest.
+        if len(candidates) > 3:
+            candidates.sort(key=len, reverse=True)
+            del candidates[3:]
+
         for candidate in candidates:
+            # Filter to the alphabet first (what a lenient decoder would
+            # quietly discard anyway), then reject on length mod 4 and
+            # decode strictly — malformed near-base64 noise bails out in
+            # C instead of round-tripping through a permissive decode.
+            core = ''.join(c for c in candidate if c in b64_chars)
+            if len(core) % 4:
+                continue
             try:
-                decoded = base64.b64decode(candidate).decode('utf-8', errors='ignore').lower()
-                if self._check_injection_patterns(decoded) or self._check_instruction_override_intent(decoded):
-                    return True
-            except Exception:
+                decoded = binascii.a2b_base64(
+                    core.encode('ascii'), strict_mode=True
+                ).decode('utf-8', errors='ignore').lower()
+            except (binascii.Error, ValueError):
                 continue
+            if self._check_injection_patterns(decoded) or self._check_instruction_override_intent(decoded):
+                return True
 
         return False
 
 
+@lru_cache(maxsize=64)
+def _validate_language_cached(lang: str) -> ValidationResult:
+    """Memoized body of InputValidator.validate_language.
+
+    Depends only on class constants, so caching is safe for the process
+    lifetime. Callers treat language ValidationResults as read-only.
+    """
+    sanitized = lang.strip().lower()
+
+    if len(sanitized) > InputValidator.MAX_LANGUAGE_CODE_LENGTH:
+        return ValidationResult(False, "", ["Invalid language code length"])
+
+    if sanitized not in InputValidator.ALLOWED_LANGUAGES:
+        return ValidationResult(
+            False, "",
+            [f"Unsupported language code: {sanitized}. Allowed: {', '.join(sorted(InputValidator.ALLOWED_LANGUAGES))}"]
+        )
+
+    return ValidationResult(True, sanitized)
+
+
 # =============================================================================
 # PROMPT INJECTION PROTECTION
 # =============================================================================
@@ -363,31 +442,45 @@ Patient symptoms: {symptoms}
 Reasoning and Assessment:""",
     }
 
+    # Triage scaffold split once at class load (delimiter already
+    # substituted), so build_triage_prompt is two concatenations instead
+    # of running str.format's parser over the ~400-char template per call.
+    # The translation templates get the same treatment lazily, per
+    # language pair, in _translation_scaffold.
+    _TRI_PREFIX, _, _TRI_SUFFIX = (
+        TEMPLATES['triage']
+        .replace('{delimiter}', DELIMITER)
+        .partition('{symptoms}')
+    )
+
+    # Single alternation compiled at class load; validate_output scans every
+    # model response, and for the common clean output one combined pass
+    # replaces five separate regex sweeps.
+    _SUSPICIOUS_OUT_RE = re.compile('|'.join(f'(?:{p})' for p in (
+        r'system\s+prompt',
+        r'developer\s+instructions?',
+        r'ignore\s+(all\s+)?(previous|above|prior)',
+        r'\{?\s*"role"\s*:\s*"(system|assistant|developer)"',
+        r'you\s+are\s+now',
+    )), re.IGNORECASE)
+
     @classmethod
     def build_translation_prompt(cls, text: str, source_lang: str = "twi",
                                   target_lang: str = "en", glossary: str = "") -> str:
-        """Build a safe translation prompt with optional medical glossary (B-05)."""
-        glossary_section = f"\nReference glossary:\n{glossary}\n" if glossary else ""
-        if target_lang == "en":
-            return cls.TEMPLATES['translate_to_english'].format(
-                source_lang=source_lang,
-                text=text,
-                delimiter=cls.DELIMITER
-            ) + glossary_section
-        else:
-            return cls.TEMPLATES['translate_from_english'].format(
-                target_lang=target_lang,
-                text=text,
-                delimiter=cls.DELIMITER
-            ) + glossary_section
+        """Build a safe translation prompt with optional medical glossary (B-05).
+
+        The template scaffold around the user text depends only on the
+        language pair and glossary — a handful of combinations in practice —
+        so it is formatted once per combination (see _translation_scaffold)
+        and the request only pays for two string concatenations.
+        """
+        prefix, suffix = _translation_scaffold(source_lang, target_lang, glossary)
+        return prefix + text + suffix
 
     @classmethod
     def build_triage_prompt(cls, symptoms: str) -> str:
         """Build a safe triage prompt."""
-        return cls.TEMPLATES['triage'].format(
-            symptoms=symptoms,
-            delimiter=cls.DELIMITER
-        )
+        return cls._TRI_PREFIX + symptoms + cls._TRI_SUFFIX
 
     @classmethod
     def validate_output(cls, output: str, expected_format: str = None) -> Tuple[bool, str]:
@@ -395,35 +488,58 @@ Reasoning and Assessment:""",
         if not output or not output.strip():
             return False, "Empty response"
 
-        # Check output length
-        # Truncate overlong output but still treat as valid
-        if len(output) > 5000:
-            output = output[:5000]
-
         # Remove any potential system prompt leakage
         cleaned = output.strip()
 
         # Check for delimiter leakage
         # C-04 fix: reject output if delimiters leak through (possible injection pass-through)
+        # Runs on the full text before truncation: a leak anywhere means
+        # rejection, so trimming first would be wasted work (and could hide
+        # a delimiter past the cut).
         if cls.DELIMITER in cleaned:
             logger.warning("Delimiter leakage detected in LLM output — rejecting")
             return False, ""
 
-        suspicious_output_patterns = [
-            r'system\s+prompt',
-            r'developer\s+instructions?',
-            r'ignore\s+(all\s+)?(previous|above|prior)',
-            r'\{?\s*"role"\s*:\s*"(system|assistant|developer)"',
-            r'you\s+are\s+now',
-        ]
-        for pattern in suspicious_output_patterns:
-            if re.search(pattern, cleaned, re.IGNORECASE):
-                logger.warning("Suspicious instruction leakage in LLM output — rejecting")
-                return False, ""
+        # Check output length
+        # Truncate overlong output but still treat as valid
+        if len(cleaned) > 5000:
+            cleaned = cleaned[:5000]
+
+        if cls._SUSPICIOUS_OUT_RE.search(cleaned):
+            logger.warning("Suspicious instruction leakage in LLM output — rejecting")
+            return False, ""
 
         return True, cleaned
 
 
+@lru_cache(maxsize=64)
+def _translation_scaffold(source_lang: str, target_lang: str,
+                          glossary: str) -> Tuple[str, str]:
+    """Format a translation template once per (languages, glossary) combo.
+
+    Returns the (prefix, suffix) surrounding the user text, produced by
+    formatting the template with a NUL sentinel in the text slot and
+    splitting on it (NUL cannot survive input sanitization, so it never
+    collides with real text). The glossary section is appended after the
+    template body, matching the original construction order.
+    """
+    glossary_section = f"\nReference glossary:\n{glossary}\n" if glossary else ""
+    if target_lang == "en":
+        filled = PromptProtector.TEMPLATES['translate_to_english'].format(
+            source_lang=source_lang,
+            text='\x00',
+            delimiter=PromptProtector.DELIMITER
+        )
+    else:
+        filled = PromptProtector.TEMPLATES['translate_from_english'].format(
+            target_lang=target_lang,
+            text='\x00',
+            delimiter=PromptProtector.DELIMITER
+        )
+    prefix, _, suffix = filled.partition('\x00')
+    return prefix, suffix + glossary_section
+
+
 # =============================================================================
 # RATE LIMITING
 # =============================================================================
@@ -438,17 +554,53 @@ class RateLimiter:
     """
 
     MAX_TRACKED_CLIENTS = 10000  # S-02: Evict oldest if exceeded
-    SWEEP_INTERVAL = 100  # B-2: Sweep every N calls
+    SWEEP_INTERVAL = 60.0  # B-2: Seconds between background sweeps
+    CB_COOLDOWN_SECONDS = 5.0  # Skip Redis this long after a failure
+
+    # Server-side rate-limit check: trim both windows, count, and record the
+    # request only when it is allowed — one round trip instead of two
+    # pipelines, atomic (no race between the read and write halves), and no
+    # ZADD wasted on denied requests. Returns {allowed, retry_after}.
+    _RL_LUA = """
+local now = tonumber(ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - 60)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[2]) then
+  return {0, 60}
+end
+redis.call('ZREMRANGEBYSCORE', KEYS[2], 0, now - 3600)
+if redis.call('ZCARD', KEYS[2]) >= tonumber(ARGV[3]) then
+  return {0, 3600}
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('EXPIRE', KEYS[1], 120)
+redis.call('ZADD', KEYS[2], now, ARGV[4])
+redis.call('EXPIRE', KEYS[2], 7200)
+return {1, 0}
+"""
 
     def __init__(self, requests_per_minute: int = 30, requests_per_hour: int = 500):
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
+        self._rl_sha: Optional[str] = None
         self._redis = self._connect_redis()
-        self._sweep_counter = 0  # B-2: Track calls for periodic sweep
-
-        # In-memory fallback
-        self._minute_buckets: Dict[str, List[float]] = defaultdict(list)
-        self._hour_buckets: Dict[str, List[float]] = defaultdict(list)
+        # Circuit breaker: after a Redis failure, requests go straight to
+        # the in-memory path until this deadline instead of each paying the
+        # connect/command timeouts against a known-bad server.
+        self._cb_open_until = 0.0
+
+        # In-memory fallback. Timestamps arrive in monotonically increasing
+        # order, so each bucket is a deque trimmed in place from the left —
+        # amortized O(1) per expired entry with no list rebuild per request.
+        self._minute_buckets: Dict[str, deque] = defaultdict(deque)
+        self._hour_buckets: Dict[str, deque] = defaultdict(deque)
+
+        # B-2: Stale clients are purged on a background timer instead of a
+        # per-request call counter, so the O(clients) scan never lands on a
+        # request thread.
+        self._sweep_thread = threading.Thread(
+            target=self._sweep_loop, daemon=True, name='rate-limit-sweep'
+        )
+        self._sweep_thread.start()
 
     def _connect_redis(self):
         """Attempt to connect to Redis (Cloud Memorystore or local)."""
@@ -459,12 +611,36 @@ class RateLimiter:
 
         try:
             import redis
+            from redis.backoff import ExponentialBackoff
+            from redis.retry import Retry
+
+            # Bounded blocking pool: under a concurrency burst, request
+            # threads wait briefly for a pooled connection instead of each
+            # opening a fresh socket — back-pressure instead of a connection
+            # storm against Memorystore. Keepalive plus periodic health
+            # checks recycle dead sockets after an idle period or failover.
+            pool_kwargs = dict(
+                max_connections=int(os.environ.get('REDIS_MAX_CONN', '16')),
+                timeout=1.0,  # max wait for a free pooled connection
+                socket_timeout=0.25,  # bound per-command wait on a hung server
+                socket_connect_timeout=0.5,
+                socket_keepalive=True,
+                health_check_interval=30,
+                retry=Retry(ExponentialBackoff(cap=1.0, base=0.1), 3),
+                retry_on_timeout=True,
+                decode_responses=True,
+            )
             if redis_url.startswith('redis://'):
-                client = redis.from_url(redis_url, decode_responses=True)
+                pool = redis.BlockingConnectionPool.from_url(redis_url, **pool_kwargs)
             else:
                 redis_port = int(os.environ.get('REDISPORT', 6379))
-                client = redis.Redis(host=redis_url, port=redis_port, decode_responses=True)
+                pool = redis.BlockingConnectionPool(
+                    host=redis_url, port=redis_port, **pool_kwargs
+                )
+            client = redis.Redis(connection_pool=pool)
             client.ping()
+            # Register the check-and-record script once; EVALSHA per request.
+            self._rl_sha = client.script_load(self._RL_LUA)
             logger.info(f"RateLimiter: Connected to Redis at {redis_url}")
             return client
         except Exception as e:
@@ -472,7 +648,25 @@ class RateLimiter:
             return None
 
     def _get_client_id(self, request) -> str:
-        """Get unique client identifier from request (S-03: validated)."""
+        """Get unique client identifier from request (S-03: validated).
+
+        Memoized on flask.g so the header parsing and IP validation run
+        once per request even when the ID is fetched again (e.g. for the
+        audit log on a blocked request). Falls back to plain computation
+        outside an application context (direct calls in tests).
+        """
+        try:
+            cached = getattr(g, '_nku_client_id', None)
+        except RuntimeError:  # no app context (direct calls in tests)
+            return self._resolve_client_id(request)
+        if cached is not None:
+            return cached
+        client_id = self._resolve_client_id(request)
+        g._nku_client_id = client_id
+        return client_id
+
+    def _resolve_client_id(self, request) -> str:
+        """Parse the client IP from headers; see _get_client_id."""
         forwarded = request.headers.get('X-Forwarded-For', '')
         if forwarded:
             ips = [ip.strip() for ip in forwarded.split(',')]
@@ -485,37 +679,53 @@ class RateLimiter:
             logger.warning(f"Invalid X-Forwarded-For value: {forwarded[:50]}")
         return request.remote_addr or 'unknown'
 
-    @staticmethod
-    def _is_valid_ip(ip: str) -> bool:
-        """S-03/S-2: IP format validation + reject private/loopback behind Cloud Run LB."""
-        parts = ip.split('.')
-        if len(parts) == 4:  # IPv4
-            if not all(p.isdigit() and 0 <= int(p) <= 255 for p in parts):
-                return False
-            # S-2 fix: Reject private/loopback IPs (should never appear behind Cloud Run LB)
-            first_octet = int(parts[0])
-            if first_octet == 127:  # loopback
-                return False
-            if first_octet == 10:  # 10.0.0.0/8
-                return False
-            if first_octet == 172 and 16 <= int(parts[1]) <= 31:  # 172.16.0.0/12
-                return False
-            if first_octet == 192 and int(parts[1]) == 168:  # 192.168.0.0/16
-                return False
-            if ip == '0.0.0.0':
-                return False
-            return True
-        if ':' in ip:  # IPv6 (basic check)
-            if ip == '::1':  # loopback
-                return False
-            return len(ip) <= 45 and all(c in '0123456789abcdefABCDEF:' for c in ip)
-        return False
+    # RFC 1918 ranges rejected for IPv4 (S-2). Deliberately NOT is_private:
+    # that predicate also covers documentation ranges (192.0.2/24 etc.),
+    # which are legitimate test values and were accepted by the original
+    # hand-rolled check.
+    _PRIVATE_IPV4_NETS = (
+        ipaddress.IPv4Network('10.0.0.0/8'),
+        ipaddress.IPv4Network('172.16.0.0/12'),
+        ipaddress.IPv4Network('192.168.0.0/16'),
+    )
+
+    @classmethod
+    def _is_valid_ip(cls, ip: str) -> bool:
+        """S-03/S-2: IP format validation + reject private/loopback behind Cloud Run LB.
+
+        ipaddress does the parse in one pass and the loopback/unspecified
+        predicates are integer comparisons, replacing the per-octet
+        split/int loop and the per-character IPv6 scan.
+        """
+        try:
+            ip_obj = ipaddress.ip_address(ip)
+        except ValueError:
+            return False
+        if ip_obj.is_loopback or ip_obj.is_unspecified:
+            return False
+        if ip_obj.version == 4:
+            return not any(ip_obj in net for net in cls._PRIVATE_IPV4_NETS)
+        return True
+
+    def _sweep_loop(self):
+        """Background sweep: runs _sweep_stale_clients every SWEEP_INTERVAL."""
+        while True:
+            time.sleep(self.SWEEP_INTERVAL)
+            try:
+                self._sweep_stale_clients()
+            except Exception:
+                logger.exception("RateLimiter: background sweep failed")
 
     def _sweep_stale_clients(self):
-        """B-2 fix: Purge clients with no requests in the last hour."""
+        """B-2 fix: Purge clients with no requests in the last hour.
+
+        Items are snapshotted because this runs on the sweep thread while
+        request threads mutate the buckets; a torn read at worst delays a
+        client's eviction to the next pass.
+        """
         cutoff = time.time() - 3600
         stale_keys = [
-            k for k, v in self._hour_buckets.items()
+            k for k, v in list(self._hour_buckets.items())
             if not v or max(v) < cutoff
         ]
         for k in stale_keys:
@@ -524,51 +734,45 @@ class RateLimiter:
         if stale_keys:
             logger.debug(f"RateLimiter: swept {len(stale_keys)} stale clients")
 
-    def _cleanup_old_entries(self, bucket: List[float], window_seconds: int) -> List[float]:
-        """Remove entries older than the window."""
-        cutoff = time.time() - window_seconds
-        return [t for t in bucket if t > cutoff]
+    @staticmethod
+    def _trim_bucket(bucket: deque, cutoff: float) -> None:
+        """Drop entries at or before the cutoff from the bucket's left end."""
+        while bucket and bucket[0] <= cutoff:
+            bucket.popleft()
 
     def _check_redis_rate_limit(self, client_id: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
-        """Check rate limit using Redis sorted sets."""
+        """Check rate limit using Redis sorted sets via one server-side script."""
         current_time = time.time()
         minute_key = f"nku:rl:min:{client_id}"
         hour_key = f"nku:rl:hr:{client_id}"
-
-        pipe = self._redis.pipeline()
-
-        # Clean old entries and count current window
-        pipe.zremrangebyscore(minute_key, 0, current_time - 60)
-        pipe.zcard(minute_key)
-        pipe.zremrangebyscore(hour_key, 0, current_time - 3600)
-        pipe.zcard(hour_key)
-
-        results = pipe.execute()
-        minute_count = results[1]
-        hour_count = results[3]
-
-        if minute_count >= self.requests_per_minute:
+        # Unique member: two requests landing on the same float timestamp
+        # would otherwise collapse into one ZSET entry and under-count.
+        member = f"{current_time}:{os.urandom(4).hex()}"
+        args = (2, minute_key, hour_key, current_time,
+                self.requests_per_minute, self.requests_per_hour, member)
+
+        if self._rl_sha is None:
+            self._rl_sha = self._redis.script_load(self._RL_LUA)
+        try:
+            allowed, retry_after = self._redis.evalsha(self._rl_sha, *args)
+        except Exception as e:
+            # Script cache flushed (e.g. Redis restart): re-register and retry.
+            if 'NOSCRIPT' not in str(e):
+                raise
+            self._rl_sha = self._redis.script_load(self._RL_LUA)
+            allowed, retry_after = self._redis.evalsha(self._rl_sha, *args)
+
+        if not allowed:
+            if retry_after == 60:
+                limit, window = self.requests_per_minute, 'minute'
+            else:
+                limit, window = self.requests_per_hour, 'hour'
             return False, {
                 'error': 'rate_limit_exceeded',
-                'message': f'Rate limit exceeded: {self.requests_per_minute} requests per minute',
-                'retry_after': 60
+                'message': f'Rate limit exceeded: {limit} requests per {window}',
+                'retry_after': retry_after
             }
 
-        if hour_count >= self.requests_per_hour:
-            return False, {
-                'error': 'rate_limit_exceeded',
-                'message': f'Rate limit exceeded: {self.requests_per_hour} requests per hour',
-                'retry_after': 3600
-            }
-
-        # Record request
-        pipe2 = self._redis.pipeline()
-        pipe2.zadd(minute_key, {str(current_time): current_time})
-        pipe2.expire(minute_key, 120)
-        pipe2.zadd(hour_key, {str(current_time): current_time})
-        pipe2.expire(hour_key, 7200)
-        pipe2.execute()
-
         return True, None
 
     def check_rate_limit(self, request) -> Tuple[bool, Optional[Dict[str, Any]]]:
@@ -578,55 +782,52 @@ class RateLimiter:
         """
         client_id = self._get_client_id(request)
 
-        # B-2 fix: Periodic TTL sweep of stale in-memory entries
-        self._sweep_counter += 1
-        if self._sweep_counter >= self.SWEEP_INTERVAL:
-            self._sweep_counter = 0
-            self._sweep_stale_clients()
-
-        # Try Redis first
-        if self._redis:
+        # Try Redis first, unless the circuit breaker is open from a recent
+        # failure — then fall through without paying the socket timeouts.
+        if self._redis and self._cb_open_until <= time.time():
             try:
                 return self._check_redis_rate_limit(client_id)
             except Exception as e:
+                self._cb_open_until = time.time() + self.CB_COOLDOWN_SECONDS
                 logger.warning(f"Redis rate limit check failed: {e}, falling back to in-memory")
 
         # In-memory fallback
         current_time = time.time()
 
-        # S-02: Evict oldest clients if we exceed cap
-        if len(self._minute_buckets) > self.MAX_TRACKED_CLIENTS:
-            oldest_keys = sorted(self._minute_buckets.keys(),
-                                 key=lambda k: self._minute_buckets[k][-1] if self._minute_buckets[k] else 0
-                                 )[:len(self._minute_buckets) - self.MAX_TRACKED_CLIENTS]
+        # S-02: Evict oldest clients if we exceed cap. nsmallest finds the
+        # k oldest in O(n log k) without sorting the whole key set.
+        excess = len(self._minute_buckets) - self.MAX_TRACKED_CLIENTS
+        if excess > 0:
+            oldest_keys = heapq.nsmallest(
+                excess, self._minute_buckets.keys(),
+                key=lambda k: self._minute_buckets[k][-1] if self._minute_buckets[k] else 0
+            )
             for k in oldest_keys:
                 del self._minute_buckets[k]
                 self._hour_buckets.pop(k, None)
 
-        self._minute_buckets[client_id] = self._cleanup_old_entries(
-            self._minute_buckets[client_id], 60
-        )
+        minute_bucket = self._minute_buckets[client_id]
+        self._trim_bucket(minute_bucket, current_time - 60)
 
-        if len(self._minute_buckets[client_id]) >= self.requests_per_minute:
+        if len(minute_bucket) >= self.requests_per_minute:
             return False, {
                 'error': 'rate_limit_exceeded',
                 'message': f'Rate limit exceeded: {self.requests_per_minute} requests per minute',
                 'retry_after': 60
             }
 
-        self._hour_buckets[client_id] = self._cleanup_old_entries(
-            self._hour_buckets[client_id], 3600
-        )
+        hour_bucket = self._hour_buckets[client_id]
+        self._trim_bucket(hour_bucket, current_time - 3600)
 
-        if len(self._hour_buckets[client_id]) >= self.requests_per_hour:
+        if len(hour_bucket) >= self.requests_per_hour:
             return False, {
                 'error': 'rate_limit_exceeded',
                 'message': f'Rate limit exceeded: {self.requests_per_hour} requests per hour',
                 'retry_after': 3600
             }
 
-        self._minute_buckets[client_id].append(current_time)
-        self._hour_buckets[client_id].append(current_time)
+        minute_bucket.append(current_time)
+        hour_bucket.append(current_time)
 
         return True, None
 
@@ -638,7 +839,6 @@ def rate_limit(limiter: Optional[RateLimiter]):
         def decorated_function(*args, **kwargs):
             if limiter is None:
                 return f(*args, **kwargs)
-            from flask import request, jsonify
 
             is_allowed, error_info = limiter.check_rate_limit(request)
             if not is_allowed:
@@ -687,12 +887,18 @@ def validate_json_request(required_fields: List[str] = None, max_size_bytes: int
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            from flask import request, jsonify
-
-            # F-007: Defense-in-depth size check (first Werkzeug catches, then we verify raw bytes here)
-            # Verify actual body size (Content-Length header can be spoofed or absent).
+            # F-007: Defense-in-depth size check. The declared Content-Length
+            # rejects oversized uploads before any buffering; the body is then
+            # read once uncached (no second copy pinned for the request
+            # lifetime, and the header can be spoofed or absent) and handed
+            # straight to the parser instead of re-read by request.get_json().
+            if (request.content_length or 0) > max_size_bytes:
+                return jsonify({
+                    'error': 'payload_too_large',
+                    'message': f'Request body exceeds maximum size of {max_size_bytes} bytes'
+                }), 413
             try:
-                raw_data = request.get_data(cache=True, as_text=False)
+                raw_data = request.get_data(cache=False, as_text=False)
                 if len(raw_data) > max_size_bytes:
                     return jsonify({
                         'error': 'payload_too_large',
@@ -713,8 +919,8 @@ def validate_json_request(required_fields: List[str] = None, max_size_bytes: int
 
             # Parse JSON
             try:
-                data = request.get_json(force=False)
-            except Exception:
+                data = json.loads(raw_data)
+            except ValueError:
                 return jsonify({
                     'error': 'invalid_json',
                     'message': 'Request body must be valid JSON'
@@ -735,6 +941,10 @@ def validate_json_request(required_fields: List[str] = None, max_size_bytes: int
                         'message': f'Missing required fields: {", ".join(missing)}'
                     }), 400
 
+            # Hand the parsed body to the endpoint so it does not go back
+            # through request.get_json().
+            g.json = data
+
             return f(*args, **kwargs)
         return decorated_function
     return decorator
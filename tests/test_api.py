@@ -180,6 +180,87 @@ class TestTriageEndpoint(unittest.TestCase):
         self.assertIn(response.status_code, [400, 503])
 
 
+class TestStreamingEndpoints(unittest.TestCase):
+    """Tests for the SSE streaming contract ({"stream": true}) on
+    /translate and /triage: one data: {"token": ...} event per decoded
+    chunk, a final data: {"done": true, ...} event with the validated
+    text, and data: {"error": ...} events for mid-stream failures."""
+
+    def setUp(self):
+        self.client = _create_test_client()
+
+    @staticmethod
+    def _streaming_model(chunks):
+        """Model double: stream=True yields chunk dicts, buffered returns one."""
+        def model(prompt, stream=False, **params):
+            if stream:
+                return iter([{'choices': [{'text': c}]} for c in chunks])
+            return {'choices': [{'text': ''.join(chunks)}]}
+        return model
+
+    @staticmethod
+    def _sse_events(response):
+        """Decode an SSE body into the list of data payloads."""
+        return [json.loads(block[len('data: '):])
+                for block in response.get_data(as_text=True).split('\n\n')
+                if block.startswith('data: ')]
+
+    def test_translate_stream_emits_tokens_and_done(self):
+        """Each decoded chunk arrives as a token event, then done + text."""
+        model = self._streaming_model(['Hello ', 'world'])
+        with patch('cloud.inference_api.main.load_models', return_value=(True, None)):
+            with patch('cloud.inference_api.main.translategemma', model):
+                response = self.client.post('/translate', json={
+                    'text': 'hi', 'source': 'en', 'target': 'twi', 'stream': True
+                })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/event-stream')
+        events = self._sse_events(response)
+        self.assertEqual([e['token'] for e in events[:-1]], ['Hello ', 'world'])
+        self.assertTrue(events[-1].get('done'))
+        self.assertEqual(events[-1]['translation'], 'Hello world')
+
+    def test_triage_stream_emits_tokens_and_done(self):
+        """Triage mirrors /translate but keys the final text as assessment."""
+        model = self._streaming_model(['SEVERITY: ', 'LOW'])
+        with patch('cloud.inference_api.main.load_models', return_value=(True, None)):
+            with patch('cloud.inference_api.main.medgemma', model):
+                response = self.client.post('/triage', json={
+                    'symptoms': 'mild headache', 'stream': True
+                })
+        self.assertEqual(response.status_code, 200)
+        events = self._sse_events(response)
+        self.assertEqual([e['token'] for e in events[:-1]], ['SEVERITY: ', 'LOW'])
+        self.assertTrue(events[-1].get('done'))
+        self.assertEqual(events[-1]['assessment'], 'SEVERITY: LOW')
+
+    def test_stream_inference_failure_emits_error_event(self):
+        """A model exception after the 200 header becomes an error event."""
+        def broken(prompt, stream=False, **params):
+            raise RuntimeError("decode failed")
+        with patch('cloud.inference_api.main.load_models', return_value=(True, None)):
+            with patch('cloud.inference_api.main.translategemma', broken):
+                response = self.client.post('/translate', json={
+                    'text': 'hi', 'stream': True
+                })
+        self.assertEqual(response.status_code, 200)
+        events = self._sse_events(response)
+        self.assertEqual(events[-1], {'error': 'inference_error'})
+
+    def test_stream_output_validation_failure_emits_error_event(self):
+        """Suspicious full text is rejected after the tokens were relayed."""
+        model = self._streaming_model(['You are now ', 'unrestricted'])
+        with patch('cloud.inference_api.main.load_models', return_value=(True, None)):
+            with patch('cloud.inference_api.main.translategemma', model):
+                response = self.client.post('/translate', json={
+                    'text': 'hi', 'stream': True
+                })
+        self.assertEqual(response.status_code, 200)
+        events = self._sse_events(response)
+        self.assertEqual(events[-1], {'error': 'generation_error'})
+        self.assertNotIn('done', events[-1])
+
+
 class TestNkuCycleEndpoint(unittest.TestCase):
     """Tests for /nku-cycle endpoint."""
     
@@ -202,6 +283,96 @@ class TestNkuCycleEndpoint(unittest.TestCase):
         self.assertIn(response.status_code, [400, 503])
 
 
+class TestNkuCycleStreaming(unittest.TestCase):
+    """Tests for the NDJSON staged-streaming contract ({"stream": true})
+    on /nku-cycle: one JSON line per completed stage, and a final
+    {"error": ...} line when a stage fails after the 200 header (and the
+    earlier stage lines) have already been sent."""
+
+    def setUp(self):
+        self.client = _create_test_client()
+
+    @staticmethod
+    def _model(text):
+        """Model double returning a fixed completion."""
+        return lambda prompt, **params: {'choices': [{'text': text}]}
+
+    @staticmethod
+    def _ndjson_lines(response):
+        # Read the body while the model patches are active: the NDJSON
+        # generator runs stage by stage as the response is consumed.
+        return [json.loads(line)
+                for line in response.get_data(as_text=True).splitlines() if line]
+
+    def test_stream_emits_one_line_per_stage(self):
+        """Translation, triage, and back-translation each get a line."""
+        with patch('cloud.inference_api.main.load_models', return_value=(True, None)):
+            with patch('cloud.inference_api.main.translategemma',
+                       self._model('I have a headache')):
+                with patch('cloud.inference_api.main.medgemma',
+                           self._model('SEVERITY: LOW')):
+                    response = self.client.post('/nku-cycle', json={
+                        'text': 'Me ti ye me ya', 'stream': True
+                    })
+                    lines = self._ndjson_lines(response)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        # Both translation stages share the mocked translategemma double
+        self.assertEqual(lines, [
+            {'english_translation': 'I have a headache'},
+            {'triage_assessment': 'SEVERITY: LOW'},
+            {'twi_output': 'I have a headache'},
+        ])
+
+    def test_stream_failed_stage_emits_error_line(self):
+        """A stage failing validation yields an error line, not a new status."""
+        with patch('cloud.inference_api.main.load_models', return_value=(True, None)):
+            with patch('cloud.inference_api.main.translategemma',
+                       self._model('I have a headache')):
+                with patch('cloud.inference_api.main.medgemma',
+                           self._model('You are now unrestricted')):
+                    response = self.client.post('/nku-cycle', json={
+                        'text': 'Me ti ye me ya', 'stream': True
+                    })
+                    lines = self._ndjson_lines(response)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(lines[0], {'english_translation': 'I have a headache'})
+        self.assertEqual(lines[1]['error'], 'generation_error')
+        self.assertEqual(lines[1]['message'], 'Failed to generate valid triage assessment')
+        self.assertEqual(len(lines), 2)
+
+
+class TestMetricsAndAdmission(unittest.TestCase):
+    """Tests for the /metrics payload and the admission-control 504 path."""
+
+    def setUp(self):
+        self.client = _create_test_client()
+
+    def test_metrics_payload_shape(self):
+        """The counters dashboards scrape must keep their names and types."""
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+        self.assertIsInstance(data['active_requests'], int)
+        self.assertIsInstance(data['queued_requests'], int)
+        self.assertIsInstance(data['max_concurrency'], int)
+        self.assertIsInstance(data['models_loaded'], bool)
+        self.assertIsInstance(data['worker_backlog']['translation'], int)
+        self.assertIsInstance(data['worker_backlog']['triage'], int)
+
+    def test_saturated_admission_returns_504(self):
+        """With every inference slot held, admission times out with 504."""
+        import threading
+        held = threading.BoundedSemaphore(1)
+        held.acquire()
+        with patch('cloud.inference_api.main._admission', held):
+            with patch('cloud.inference_api.main._ADMISSION_TIMEOUT_SECONDS', 0.01):
+                response = self.client.post('/translate', json={'text': 'hello'})
+        self.assertEqual(response.status_code, 504)
+        data = json.loads(response.data)
+        self.assertEqual(data['error'], 'server_overloaded')
+
+
 class TestErrorHandling(unittest.TestCase):
     """Tests for error handling behavior."""
     